@@ -1,11 +1,15 @@
 import os
 import logging
+import time
 import asyncio
 import psutil
-import psycopg2
-from datetime import datetime
+import asyncpg
+import redis.asyncio as aioredis
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
 from telegram import Update
-from telegram.ext import ApplicationBuilder, ContextTypes, CommandHandler
+from telegram.constants import ParseMode
+from telegram.ext import ApplicationBuilder, ContextTypes, CommandHandler, MessageHandler, filters
 
 # Logging configuration
 logging.basicConfig(
@@ -17,66 +21,221 @@ logger = logging.getLogger(__name__)
 # Environment Variables
 TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
 ADMIN_ID = int(os.getenv("TELEGRAM_ADMIN_ID", "0"))
+TZ = os.getenv("TZ", "Asia/Seoul")
+# Webhook 모드 (설정 시 polling 대신 Telegram이 업데이트를 push)
+# 예: TELEGRAM_WEBHOOK_URL=https://bot.example.com (TLS는 nginx/Caddy 등 리버스 프록시에서 처리)
+WEBHOOK_URL = os.getenv("TELEGRAM_WEBHOOK_URL")
+WEBHOOK_PORT = int(os.getenv("TELEGRAM_WEBHOOK_PORT", "8443"))
+WEBHOOK_SECRET = os.getenv("TELEGRAM_WEBHOOK_SECRET")
 POSTGRES_HOST = os.getenv("POSTGRES_HOST", "postgres")
 POSTGRES_DB = os.getenv("POSTGRES_DB", "clawd_db")
 POSTGRES_USER = os.getenv("POSTGRES_USER", "clawd_user")
 POSTGRES_PASSWORD = os.getenv("POSTGRES_PASSWORD", "password")
+DB_POOL_MIN = int(os.getenv("DB_POOL_MIN", "2"))
+DB_POOL_MAX = int(os.getenv("DB_POOL_MAX", "10"))
+REDIS_HOST = os.getenv("REDIS_HOST", "redis")
+REDIS_PORT = int(os.getenv("REDIS_PORT", "6379"))
+REDIS_DB = int(os.getenv("REDIS_DB", "0"))
+REDIS_PASSWORD = os.getenv("REDIS_PASSWORD")
 
-def get_db_connection():
-    return psycopg2.connect(
+# /brief 캐시: 하루 단위로 키를 나누고, 자정 이후 워커 동기화 여유시간(5분)까지 유지
+# worker-garmin이 health_daily를 저장할 때 brief:<date> 키를 삭제해 무효화함
+BRIEF_CACHE_PREFIX = "brief"
+BRIEF_CACHE_GRACE_SEC = 300
+
+# /brief 조회 컬럼 (raw_data JSONB 등 불필요한 컬럼은 가져오지 않음)
+# 순서가 brief()의 언패킹 순서와 일치해야 함
+BRIEF_QUERY = (
+    "SELECT date, sleep_hours, sleep_score, resting_hr, hrv_status, stress_level "
+    "FROM health_daily ORDER BY date DESC LIMIT 2"
+)
+
+# 응답 메시지 템플릿 (모듈 로드 시 한 번만 생성)
+START_MSG = (
+    "👋 안녕하세요! Clawd-Bot입니다.\n"
+    "당신의 VPS에서 가동 중입니다.\n\n"
+    "명령어:\n"
+    "/brief - 오늘 건강 요약\n"
+    "/status - 서버 상태 확인\n"
+    "/help - 도움말"
+)
+_STATUS_TMPL = (
+    "🖥 **서버 상태**\n"
+    "- CPU 사용률: {cpu}%\n"
+    "- 메모리 사용률: {mem}%\n"
+    "- 디스크 사용률: {disk}%\n"
+    "- 시스템 부팅일: {boot}\n"
+    "- 봇 프로세스: RSS {rss_mb:.1f}MB, 스레드 {threads}개"
+)
+_BRIEF_TMPL = (
+    "📊 **건강 브리핑 ({date})** {note}\n\n"
+    "💤 수면: {sleep_h}시간 (점수: {sleep_s})\n"
+    "💓 안정 시 심박수: {rhr} bpm\n"
+    "📈 HRV 상태: {hrv}\n"
+    "😫 평균 스트레스: {stress}\n\n"
+    "가장 최근 확정된 데이터 기준입니다."
+)
+
+# 봇 자신의 프로세스 핸들 (oneshot()으로 /proc 읽기를 묶어서 사용)
+_proc = psutil.Process(os.getpid())
+
+# 날짜 경계 계산용 타임존 / 시각 포맷 (모듈 로드 시 한 번만 생성)
+_TZ = ZoneInfo(TZ)
+_BOOT_FMT = "%Y-%m-%d %H:%M:%S"
+
+# 부팅 시각은 프로세스 수명 동안 변하지 않으므로 한 번만 계산
+BOOT_TIME_STR = datetime.fromtimestamp(psutil.boot_time()).strftime(_BOOT_FMT)
+
+# /status psutil 샘플 캐시: 최소 간격 이내의 반복 호출은 직전 값을 재사용
+STATS_MIN_INTERVAL_SEC = 1.0
+_stats_cache = {"t": 0.0, "val": None}
+
+# asyncpg connection pool (created once in post_init, shared by all handlers)
+pool = None
+# Redis client for the /brief cache (None if Redis is not reachable)
+rcache = None
+
+async def _warm_statement_cache(conn):
+    # asyncpg는 conn.fetch()에 쓰인 쿼리를 연결별 statement cache에 prepare해 둠.
+    # 새 연결마다 BRIEF_QUERY를 한 번 실행해 두면 /brief에서 parse/plan 비용이 들지 않음
+    # (conn.prepare()는 캐시를 거치지 않으므로 사용하지 않음)
+    await conn.fetch(BRIEF_QUERY)
+
+async def init_db_pool(application):
+    global pool
+    pool = await asyncpg.create_pool(
         host=POSTGRES_HOST,
         database=POSTGRES_DB,
         user=POSTGRES_USER,
-        password=POSTGRES_PASSWORD
+        password=POSTGRES_PASSWORD,
+        min_size=DB_POOL_MIN,
+        max_size=DB_POOL_MAX,
+        # 연결을 주기적으로 재생성하지 않음 (요청마다 핸드셰이크 비용이 들지 않도록)
+        max_inactive_connection_lifetime=0,
+        init=_warm_statement_cache
+    )
+    logger.info("DB connection pool ready.")
+
+async def init_redis(application):
+    global rcache
+    client = aioredis.Redis(
+        host=REDIS_HOST,
+        port=REDIS_PORT,
+        db=REDIS_DB,
+        password=REDIS_PASSWORD,
+        decode_responses=True,
+        socket_timeout=2,
+        socket_connect_timeout=2
     )
+    try:
+        await client.ping()
+        rcache = client
+        logger.info("Redis cache ready.")
+    except aioredis.RedisError as e:
+        logger.warning("Redis not available, /brief cache disabled: %s", e)
+
+async def post_init(application):
+    await init_db_pool(application)
+    await init_redis(application)
+
+async def post_shutdown(application):
+    if pool is not None:
+        await pool.close()
+    if rcache is not None:
+        await rcache.close()
+    logger.info("DB pool and Redis client closed.")
+
+def seconds_until_midnight():
+    now = datetime.now(_TZ)
+    midnight = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    return int((midnight - now).total_seconds())
 
-async def check_admin(update: Update):
-    if update.effective_user.id != ADMIN_ID:
-        await update.message.reply_text("⛔ 접근 권한이 없습니다.")
-        return False
-    return True
+async def brief_cache_get(key):
+    if rcache is None:
+        return None
+    try:
+        return await rcache.get(key)
+    except aioredis.RedisError as e:
+        logger.warning("Brief cache get error for %s: %s", key, e)
+        return None
+
+async def brief_cache_set(key, msg):
+    if rcache is None:
+        return
+    try:
+        await rcache.set(key, msg, ex=seconds_until_midnight() + BRIEF_CACHE_GRACE_SEC)
+    except aioredis.RedisError as e:
+        logger.warning("Brief cache set error for %s: %s", key, e)
+
+# 관리자 여부는 핸들러 등록 시 필터로 검사 (관리자가 아니면 명령 핸들러가 실행되지 않음)
+admin_filter = filters.User(user_id=ADMIN_ID)
+
+# 비관리자 거부 메시지는 사용자별로 DENY_REPLY_INTERVAL_SEC에 한 번만 전송
+# (스팸 시 매번 Telegram API를 호출하지 않도록)
+DENY_REPLY_INTERVAL_SEC = 60
+_last_deny: dict[int, float] = {}
+
+async def deny(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    uid = update.effective_user.id
+    now = time.monotonic()
+    if now - _last_deny.get(uid, float("-inf")) < DENY_REPLY_INTERVAL_SEC:
+        return
+    if len(_last_deny) > 1000:
+        for k, t in list(_last_deny.items()):
+            if now - t >= DENY_REPLY_INTERVAL_SEC:
+                del _last_deny[k]
+    _last_deny[uid] = now
+    await update.message.reply_text("⛔ 접근 권한이 없습니다.")
+
+async def _reply_md(update: Update, msg: str):
+    # Markdown 파싱은 **…** 서식이 있는 메시지(/status, /brief)에만 사용하고
+    # 일반 텍스트 응답은 reply_text()로 바로 보냄 (_, * 등이 포함된 문구의 이스케이프 문제 방지)
+    await update.message.reply_text(msg, parse_mode=ParseMode.MARKDOWN)
 
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    if not await check_admin(update): return
-    await update.message.reply_text(
-        "👋 안녕하세요! Clawd-Bot입니다.\n"
-        "당신의 VPS에서 가동 중입니다.\n\n"
-        "명령어:\n"
-        "/brief - 오늘 건강 요약\n"
-        "/status - 서버 상태 확인\n"
-        "/help - 도움말"
-    )
+    await update.message.reply_text(START_MSG)
 
-async def status(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    if not await check_admin(update): return
-    
+def _sample_stats():
     cpu = psutil.cpu_percent()
     mem = psutil.virtual_memory().percent
     disk = psutil.disk_usage('/').percent
-    boot_time = datetime.fromtimestamp(psutil.boot_time()).strftime("%Y-%m-%d %H:%M:%S")
+    # oneshot() 안에서는 /proc/<pid> 파일을 한 번만 읽고 여러 getter가 공유함
+    with _proc.oneshot():
+        rss_mb = _proc.memory_info().rss / (1024 * 1024)
+        threads = _proc.num_threads()
+    return cpu, mem, disk, BOOT_TIME_STR, rss_mb, threads
+
+async def status(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    now = time.monotonic()
+    if _stats_cache["val"] and now - _stats_cache["t"] < STATS_MIN_INTERVAL_SEC:
+        stats = _stats_cache["val"]
+    else:
+        # psutil 호출은 블로킹 syscall이므로 이벤트 루프 밖에서 실행
+        stats = await asyncio.to_thread(_sample_stats)
+        _stats_cache["t"] = now
+        _stats_cache["val"] = stats
+    cpu, mem, disk, boot_time, rss_mb, threads = stats
     
-    msg = (
-        "🖥 **서버 상태**\n"
-        f"- CPU 사용률: {cpu}%\n"
-        f"- 메모리 사용률: {mem}%\n"
-        f"- 디스크 사용률: {disk}%\n"
-        f"- 시스템 부팅일: {boot_time}"
+    msg = _STATUS_TMPL.format(
+        cpu=cpu, mem=mem, disk=disk, boot=boot_time, rss_mb=rss_mb, threads=threads
     )
-    await update.message.reply_text(msg, parse_mode='Markdown')
+    await _reply_md(update, msg)
 
 async def brief(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    if not await check_admin(update): return
-    
+    today = datetime.now(_TZ).date()
+    cache_key = f"{BRIEF_CACHE_PREFIX}:{today}"
+    cached = await brief_cache_get(cache_key)
+    if cached:
+        await _reply_md(update, cached)
+        return
+
     await update.message.reply_chat_action("typing")
     
     try:
-        conn = get_db_connection()
-        cur = conn.cursor()
         # 최근 2일 데이터를 가져옴 (오늘, 어제)
-        cur.execute("SELECT * FROM health_daily ORDER BY date DESC LIMIT 2")
-        rows = cur.fetchall()
-        cur.close()
-        conn.close()
+        # acquire()를 컨텍스트 매니저로 사용해 예외가 나도 연결이 풀로 반환되도록 함
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(BRIEF_QUERY)
         
         if rows:
             # 기본적으로 가장 최근 데이터(오늘 아침 일어난 기록)를 타겟으로 잡음
@@ -91,40 +250,65 @@ async def brief(update: Update, context: ContextTypes.DEFAULT_TYPE):
             else:
                 note = ""
 
-            date = target[0]
-            sleep_h = target[1]
-            sleep_s = target[2]
-            rhr = target[3]
-            hrv = target[4]
-            stress = target[5]
+            date, sleep_h, sleep_s, rhr, hrv, stress = target
             
-            msg = (
-                f"📊 **건강 브리핑 ({date})** {note}\n\n"
-                f"💤 수면: {sleep_h}시간 (점수: {sleep_s})\n"
-                f"💓 안정 시 심박수: {rhr} bpm\n"
-                f"📈 HRV 상태: {hrv}\n"
-                f"😫 평균 스트레스: {stress}\n\n"
-                "가장 최근 확정된 데이터 기준입니다."
+            msg = _BRIEF_TMPL.format(
+                date=date, note=note, sleep_h=sleep_h, sleep_s=sleep_s,
+                rhr=rhr, hrv=hrv, stress=stress
             )
+            # 오늘 날짜 기록일 때만 캐시 (worker-garmin은 brief:<기록 날짜>만 삭제하므로,
+            # 이전 날짜 기록을 오늘 키에 넣으면 재동기화 후에도 무효화되지 않음)
+            if date == today:
+                await brief_cache_set(cache_key, msg)
         else:
-            msg = "데이터가 아직 수집되지 않았습니다. Garmin 워커가 작동 중인지 확인해주세요."
+            msg = None
             
-    except Exception as e:
-        msg = f"❌ 데이터 조회 중 오류 발생: {e}"
-        logger.error(msg)
-        
-    await update.message.reply_text(msg, parse_mode='Markdown')
+    except Exception:
+        # 예외 메시지(SQL 등)는 채팅으로 보내지 않고 traceback과 함께 로그에만 남김
+        logger.exception("brief DB query failed")
+        await update.message.reply_text("❌ 데이터 조회 중 오류 발생")
+        return
+
+    if msg:
+        await _reply_md(update, msg)
+    else:
+        await update.message.reply_text("데이터가 아직 수집되지 않았습니다. Garmin 워커가 작동 중인지 확인해주세요.")
 
 if __name__ == '__main__':
     if not TOKEN:
         logger.error("TELEGRAM_BOT_TOKEN이 설정되지 않았습니다.")
         exit(1)
 
-    application = ApplicationBuilder().token(TOKEN).build()
+    # uvloop이 설치되어 있으면 asyncio 기본 루프 대신 사용
+    try:
+        import uvloop
+        uvloop.install()
+        logger.info("Using uvloop event loop.")
+    except ImportError:
+        pass
+
+    application = (
+        ApplicationBuilder()
+        .token(TOKEN)
+        .post_init(post_init)
+        .post_shutdown(post_shutdown)
+        .build()
+    )
     
-    application.add_handler(CommandHandler('start', start))
-    application.add_handler(CommandHandler('status', status))
-    application.add_handler(CommandHandler('brief', brief))
+    application.add_handler(CommandHandler('start', start, filters=admin_filter))
+    application.add_handler(CommandHandler('status', status, filters=admin_filter))
+    application.add_handler(CommandHandler('brief', brief, filters=admin_filter))
+    application.add_handler(MessageHandler(filters.COMMAND & ~admin_filter, deny))
     
-    logger.info("Bot started and waiting for messages...")
-    application.run_polling()
+    if WEBHOOK_URL:
+        logger.info("Bot started in webhook mode on port %s", WEBHOOK_PORT)
+        application.run_webhook(
+            listen="0.0.0.0",
+            port=WEBHOOK_PORT,
+            url_path=TOKEN,
+            webhook_url=f"{WEBHOOK_URL.rstrip('/')}/{TOKEN}",
+            secret_token=WEBHOOK_SECRET
+        )
+    else:
+        logger.info("Bot started and waiting for messages...")
+        application.run_polling()
@@ -1,26 +1,18 @@
 #!/usr/bin/env python3
 """Test script for agent tools (can run without full dependencies)."""
-import sys
-import importlib.util
-
-
-def load_module(name, path):
-    """Load a module from file path."""
-    spec = importlib.util.spec_from_file_location(name, path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
 
 
 def main():
     print("Testing Agent Tools System")
     print("=" * 50)
 
-    # Load modules
-    registry_mod = load_module("registry", "agent/tools/registry.py")
-    health_mod = load_module("health", "agent/tools/health.py")
-    exercise_mod = load_module("exercise", "agent/tools/exercise.py")
-    calendar_mod = load_module("calendar", "agent/tools/calendar.py")
+    # Load modules (regular package imports so the .pyc cache is reused)
+    from agent.tools import (
+        registry as registry_mod,
+        health as health_mod,
+        exercise as exercise_mod,
+        calendar as calendar_mod,
+    )
 
     ToolRegistry = registry_mod.ToolRegistry
 
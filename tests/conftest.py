@@ -1,22 +1,27 @@
 import pytest
 import os
 import sys
+import importlib.util
 from unittest.mock import MagicMock
 
-# Add workers to path for testing
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'workers', 'worker-garmin'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'workers', 'worker-brief'))
+# redis is optional for tests; only check availability here and import lazily in mock_redis
+REDIS_AVAILABLE = importlib.util.find_spec("redis") is not None
 
-# Try importing redis, but it's optional for tests
-try:
-    import redis
-    REDIS_AVAILABLE = True
-except ImportError:
-    REDIS_AVAILABLE = False
-    redis = None
 
+@pytest.fixture(scope="session", autouse=True)
+def _setup_paths():
+    """Add workers to path for testing (once per session)."""
+    base = os.path.join(os.path.dirname(__file__), '..', 'workers')
+    for worker in ('worker-garmin', 'worker-brief'):
+        path = os.path.join(base, worker)
+        if path not in sys.path:
+            sys.path.insert(0, path)
 
-@pytest.fixture
+
+# Read-only sample payloads: built once per session. Tests that need to mutate
+# one should copy.deepcopy() it first.
+
+@pytest.fixture(scope="session")
 def sample_garmin_activity():
     """Sample Garmin activity data for testing."""
     return {
@@ -34,7 +39,7 @@ def sample_garmin_activity():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_health_data():
     """Sample health daily data for testing."""
     return {
@@ -49,7 +54,7 @@ def sample_health_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_sleep_data():
     """Sample Garmin sleep data response."""
     return {
@@ -60,7 +65,7 @@ def sample_sleep_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_user_summary():
     """Sample Garmin user summary response."""
     return {
@@ -81,6 +86,7 @@ def sample_user_summary():
 def mock_redis():
     """Mock Redis client for testing."""
     if REDIS_AVAILABLE:
+        import redis
         mock_client = MagicMock(spec=redis.Redis)
     else:
         mock_client = MagicMock()
@@ -0,0 +1,17 @@
+"""Helpers shared by tests."""
+import os
+import sys
+import importlib.util
+
+REPO_ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+
+def load_module(name, *path_parts):
+    """Import a repo source file by path (several workers share the module name main.py)."""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, os.path.join(REPO_ROOT, *path_parts))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    sys.modules[name] = module
+    return module
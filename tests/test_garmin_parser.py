@@ -1,16 +1,13 @@
 import pytest
 
+from tests.helpers import load_module
+
 
 def test_format_pace():
     """Test pace formatting from speed."""
-    # Import the function (would need to be extracted to a utils module)
-    def format_pace(speed_mps):
-        if not speed_mps or speed_mps <= 0:
-            return None
-        pace_sec_per_km = 1000 / speed_mps
-        minutes = int(pace_sec_per_km // 60)
-        seconds = int(pace_sec_per_km % 60)
-        return f"{minutes}:{seconds:02d}"
+    for dep in ("garminconnect", "psycopg2", "schedule"):
+        pytest.importorskip(dep)
+    format_pace = load_module("worker_garmin_main", "workers", "worker-garmin", "main.py").format_pace
 
     # Test cases
     assert format_pace(3.0) == "5:33"  # ~5:33/km pace
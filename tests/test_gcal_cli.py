@@ -0,0 +1,94 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from tests.helpers import load_module
+
+gcal_cli = load_module("gcal_cli", "tools", "gcal", "gcal_cli.py")
+
+
+def _mock_service(fail_ids=()):
+    """Service whose batch requests invoke the callback once per added call."""
+    service = MagicMock()
+
+    def new_batch_http_request(callback):
+        added = []
+        batch = MagicMock()
+        batch.add.side_effect = lambda request, request_id: added.append(request_id)
+
+        def execute():
+            for request_id in added:
+                error = Exception("404 Not Found") if request_id in fail_ids else None
+                callback(request_id, None, error)
+
+        batch.execute.side_effect = execute
+        return batch
+
+    service.new_batch_http_request.side_effect = new_batch_http_request
+    return service
+
+
+def _events(*ids):
+    return [
+        {"id": ev_id, "summary": "치과", "start": {"dateTime": "2026-01-30T10:00:00+09:00"},
+         "end": {"dateTime": "2026-01-30T11:00:00+09:00"}}
+        for ev_id in ids
+    ]
+
+
+def test_delete_batch_deletes_all_matches(capsys):
+    """Every matched event is deleted (--force semantics)."""
+    service = _mock_service()
+
+    gcal_cli._delete_batch(service, "cal", _events("a", "b", "c"))
+
+    out = capsys.readouterr().out
+    assert "deleted id=a" in out
+    assert "deleted id=b" in out
+    assert "deleted id=c" in out
+    deleted = [c.kwargs["eventId"] for c in service.events().delete.call_args_list]
+    assert deleted == ["a", "b", "c"]
+
+
+def test_delete_batch_reports_failures_with_nonzero_exit(capsys):
+    """A failed delete inside the batch is reported and exits with code 1."""
+    service = _mock_service(fail_ids={"b"})
+
+    with pytest.raises(SystemExit) as exc:
+        gcal_cli._delete_batch(service, "cal", _events("a", "b"))
+
+    assert exc.value.code == 1
+    captured = capsys.readouterr()
+    assert "deleted id=a" in captured.out
+    assert "failed id=b" in captured.err
+    assert "1 of 2 deletes failed" in captured.err
+
+
+def test_delete_batch_splits_at_batch_limit():
+    """More events than _BATCH_LIMIT are sent as several batch requests."""
+    service = _mock_service()
+    ids = [f"ev{i}" for i in range(gcal_cli._BATCH_LIMIT + 1)]
+
+    gcal_cli._delete_batch(service, "cal", _events(*ids))
+
+    assert service.new_batch_http_request.call_count == 2
+
+
+def test_build_service_missing_transitive_dep_shows_install_hint(monkeypatch, capsys):
+    """A dependency missing inside a lazily loaded module exits with the pip hint."""
+    class _MissingDep:
+        def __getattr__(self, name):
+            raise ModuleNotFoundError("No module named 'google_auth_httplib2'")
+
+    monkeypatch.setattr(gcal_cli, "_GOOGLE_IMPORT_ERROR", None)
+    monkeypatch.setattr(gcal_cli, "service_account", _MissingDep(), raising=False)
+    monkeypatch.setattr(gcal_cli, "_discovery", _MissingDep(), raising=False)
+    gcal_cli._build_service.cache_clear()
+
+    with pytest.raises(SystemExit) as exc:
+        gcal_cli._build_service("sa.json")
+
+    assert exc.value.code == 2
+    err = capsys.readouterr().err
+    assert "pip install" in err
+    assert "google_auth_httplib2" in err
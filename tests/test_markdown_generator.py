@@ -1,6 +1,9 @@
 import pytest
+import asyncio
 import datetime
 
+from tests.helpers import load_module
+
 
 def test_health_markdown_format(sample_health_data):
     """Test health markdown generation format."""
@@ -65,13 +68,13 @@ def test_activity_markdown_format(sample_garmin_activity):
 
 def test_format_duration():
     """Test duration formatting helper."""
+    # Reference format only: worker-brief renders this in SQL (ACTIVITY_COLUMNS)
     def format_duration(seconds):
         if not seconds:
             return "N/A"
         minutes = seconds // 60
         if minutes >= 60:
-            hours = minutes // 60
-            mins = minutes % 60
+            hours, mins = divmod(minutes, 60)
             return f"{hours}h {mins}m"
         return f"{minutes}m"
 
@@ -82,16 +85,24 @@ def test_format_duration():
     assert format_duration(None) == "N/A"
 
 
-def test_briefing_message_format(sample_health_data):
-    """Test morning briefing message format."""
+def test_briefing_message_format(sample_health_data, monkeypatch):
+    """Test morning briefing message format (worker-brief's real builder)."""
+    for dep in ("asyncpg", "pytz", "telegram"):
+        pytest.importorskip(dep)
+    worker_brief = load_module("worker_brief_main", "workers", "worker-brief", "main.py")
     health = sample_health_data
+    now = worker_brief._TZ.localize(datetime.datetime(2026, 1, 26, 8, 0))
+
+    async def get_briefing_data(today, activity_limit):
+        return {health['date']: dict(health)}, []
+
+    async def get_external_data():
+        return None, [], {}
 
-    lines = ["🌅 *Good Morning!*\n"]
-    lines.append(f"😴 *어제 수면*: {health['sleep_hours']}시간 (점수: {health['sleep_score']})")
-    lines.append(f"🔋 *Body Battery*: {health['body_battery_max']}%")
-    lines.append(f"💓 *안정시 심박수*: {health['resting_hr']} bpm")
+    monkeypatch.setattr(worker_brief, "get_briefing_data", get_briefing_data)
+    monkeypatch.setattr(worker_brief, "get_external_data", get_external_data)
 
-    message = "\n".join(lines)
+    message = asyncio.run(worker_brief._build_briefing_message(now))
 
     assert "Good Morning" in message
     assert "7.5시간" in message
@@ -0,0 +1,44 @@
+import io
+import json
+import datetime
+
+import pytest
+
+pytest.importorskip("psycopg2")
+
+from tests.helpers import load_module
+
+query = load_module("worker_brief_query", "workers", "worker-brief", "query.py")
+
+
+def _write(records):
+    out = io.StringIO()
+    query.write_json_array(records, out)
+    return out.getvalue()
+
+
+def test_write_json_array_empty():
+    """No records is still a valid (empty) JSON array."""
+    assert _write(iter([])) == "[]\n"
+    assert json.loads(_write(iter([]))) == []
+
+
+def test_write_json_array_streams_generator():
+    """Records from a generator come out as one JSON array, one object per line."""
+    records = [
+        {"date": "2026-01-26", "sleep_hours": 7.5, "hrv_status": "BALANCED"},
+        {"date": "2026-01-25", "sleep_hours": None, "hrv_status": None},
+    ]
+
+    text = _write(r for r in records)
+
+    assert json.loads(text) == records
+    assert text.count("\n") == len(records) + 2
+
+
+def test_write_json_array_keeps_non_ascii_and_dates():
+    """Korean text is written as-is; non-JSON types go through str()."""
+    text = _write(iter([{"name": "아침 러닝", "start_time": datetime.date(2026, 1, 26)}]))
+
+    assert "아침 러닝" in text
+    assert json.loads(text) == [{"name": "아침 러닝", "start_time": "2026-01-26"}]
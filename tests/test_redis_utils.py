@@ -0,0 +1,265 @@
+import json
+
+import pytest
+
+pytest.importorskip("redis")
+
+from tests.helpers import load_module
+
+redis_utils = load_module("redis_utils", "workers", "shared", "redis_utils.py")
+
+
+def _pipe(client):
+    """The pipeline object used inside `with client.pipeline(...) as pipe`."""
+    return client.pipeline.return_value.__enter__.return_value
+
+
+@pytest.fixture
+def queue(mock_redis, monkeypatch):
+    monkeypatch.setattr(redis_utils, "_redis_client", mock_redis)
+    mock_redis.xautoclaim.return_value = ["0-0", [], []]
+    mock_redis.xreadgroup.return_value = []
+    return redis_utils.JobQueue("test", consumer="c1")
+
+
+def test_job_queue_push_creates_group_once(queue, mock_redis):
+    """push() creates the stream/group on first use and XADDs the job as JSON."""
+    assert queue.push({"task": "sync", "n": 1})
+    assert queue.push({"task": "sync", "n": 2})
+
+    mock_redis.xgroup_create.assert_called_once_with("queue:test", "workers", id="0", mkstream=True)
+    assert mock_redis.xadd.call_count == 2
+    key, fields = mock_redis.xadd.call_args.args
+    assert key == "queue:test"
+    assert json.loads(fields["data"]) == {"task": "sync", "n": 2}
+
+
+def test_job_queue_existing_group_is_not_an_error(queue, mock_redis):
+    """BUSYGROUP (group already created by another worker) is ignored."""
+    mock_redis.xgroup_create.side_effect = redis_utils.redis.ResponseError("BUSYGROUP Consumer Group name already exists")
+
+    assert queue.push({"task": "sync"})
+    mock_redis.xadd.assert_called_once()
+
+
+def test_job_queue_pop_attaches_entry_id(queue, mock_redis):
+    """Popped jobs carry their stream entry id under JOB_ID_KEY."""
+    mock_redis.xreadgroup.return_value = [["queue:test", [("1-0", {"data": '{"task": "sync"}'})]]]
+
+    job = queue.pop()
+
+    assert job == {"task": "sync", redis_utils.JOB_ID_KEY: "1-0"}
+    mock_redis.xreadgroup.assert_called_once_with("workers", "c1", {"queue:test": ">"}, count=1, block=None)
+
+
+def test_job_queue_pop_blocks_in_milliseconds(queue, mock_redis):
+    """A pop timeout in seconds becomes XREADGROUP BLOCK in milliseconds."""
+    assert queue.pop(timeout=2) is None
+    assert mock_redis.xreadgroup.call_args.kwargs["block"] == 2000
+
+
+def test_job_queue_complete_acks_and_deletes(queue, mock_redis):
+    """complete() acknowledges and deletes the entry in one transaction."""
+    pipe = _pipe(mock_redis)
+
+    assert queue.complete({"task": "sync", redis_utils.JOB_ID_KEY: "1-0"})
+
+    pipe.xack.assert_called_once_with("queue:test", "workers", "1-0")
+    pipe.xdel.assert_called_once_with("queue:test", "1-0")
+    pipe.execute.assert_called_once()
+
+
+def test_job_queue_complete_requires_entry_id(queue, mock_redis):
+    """A job that was not popped from the queue cannot be completed."""
+    assert queue.complete({"task": "sync"}) is False
+    _pipe(mock_redis).execute.assert_not_called()
+
+
+def test_job_queue_fail_moves_job_to_failed_stream(queue, mock_redis):
+    """fail() acks the entry and stores the job (without its id) with the error."""
+    pipe = _pipe(mock_redis)
+
+    assert queue.fail({"task": "sync", redis_utils.JOB_ID_KEY: "1-0"}, "boom")
+
+    pipe.xack.assert_called_once_with("queue:test", "workers", "1-0")
+    pipe.xdel.assert_called_once_with("queue:test", "1-0")
+    key, fields = pipe.xadd.call_args.args
+    assert key == "queue:test:failed"
+    failed = json.loads(fields["data"])
+    assert failed["task"] == "sync"
+    assert failed["error"] == "boom"
+    assert redis_utils.JOB_ID_KEY not in failed
+
+
+def test_job_queue_size_excludes_pending(queue, mock_redis):
+    """size() counts entries not yet delivered to any consumer."""
+    _pipe(mock_redis).execute.return_value = [5, {"pending": 2}]
+
+    assert queue.size() == 3
+
+
+def test_job_queue_reclaims_stale_entries_first(queue, mock_redis):
+    """Entries idle past the visibility timeout are re-delivered before new ones."""
+    mock_redis.xautoclaim.return_value = [
+        "0-0",
+        [("1-0", {"data": '{"task": "stale"}'}), ("2-0", None)],  # 2-0 was deleted while pending
+        [],
+    ]
+    mock_redis.xreadgroup.return_value = [["queue:test", [("3-0", {"data": '{"task": "new"}'})]]]
+
+    jobs = queue.pop_batch(2)
+
+    assert [job["task"] for job in jobs] == ["stale", "new"]
+    assert [job[redis_utils.JOB_ID_KEY] for job in jobs] == ["1-0", "3-0"]
+    mock_redis.xautoclaim.assert_called_once_with(
+        "queue:test", "workers", "c1", 300 * 1000, start_id="0-0", count=2
+    )
+    # Only the one slot not filled by a reclaimed entry is read, without blocking
+    assert mock_redis.xreadgroup.call_args.kwargs == {"count": 1, "block": None}
+
+
+def test_job_queue_reclaim_checked_once_per_window(queue, mock_redis):
+    """With nothing stale, XAUTOCLAIM is not repeated until the visibility window passes."""
+    queue.pop()
+    queue.pop()
+
+    mock_redis.xautoclaim.assert_called_once()
+    assert mock_redis.xreadgroup.call_count == 2
+
+
+def test_make_key_without_args_is_prefix():
+    """A call without arguments uses the bare prefix."""
+    assert redis_utils._make_key("weather", (), {}) == "weather"
+
+
+def test_make_key_joins_args_and_sorted_kwargs():
+    """kwargs order does not change the key."""
+    key = redis_utils._make_key("weather", ("Seoul", 3), {"units": "metric", "lang": "kr"})
+    assert key == "weather:Seoul:3:lang=kr:units=metric"
+    assert key == redis_utils._make_key("weather", ("Seoul", 3), {"lang": "kr", "units": "metric"})
+
+
+def test_make_key_shortens_long_keys():
+    """Keys over MAX_CACHE_KEY_LENGTH become prefix + stable digest."""
+    args = ("x" * redis_utils.MAX_CACHE_KEY_LENGTH,)
+    key = redis_utils._make_key("weather", args, {})
+
+    assert key.startswith("weather:")
+    assert len(key) < redis_utils.MAX_CACHE_KEY_LENGTH
+    assert key == redis_utils._make_key("weather", args, {})
+    assert key != redis_utils._make_key("weather", ("y" * redis_utils.MAX_CACHE_KEY_LENGTH,), {})
+
+
+_LARGE_VALUE = {"rows": [{"id": i, "name": f"activity {i}"} for i in range(200)]}
+
+
+def test_cache_value_small_is_stored_plain():
+    """Payloads up to COMPRESS_MIN_BYTES are plain JSON."""
+    data = redis_utils._encode_cache_value({"a": 1})
+    if isinstance(data, str):
+        data = data.encode()
+
+    assert not data.startswith(redis_utils._ZSTD_MAGIC)
+    assert redis_utils._decode_cache_value(data) == {"a": 1}
+
+
+def test_cache_value_large_is_compressed():
+    """Large payloads are zstd frames and decode back to the same value."""
+    if redis_utils._zstd_compress is None:
+        pytest.skip("zstandard not installed")
+    data = redis_utils._encode_cache_value(_LARGE_VALUE)
+
+    assert data.startswith(redis_utils._ZSTD_MAGIC)
+    assert redis_utils._decode_cache_value(data) == _LARGE_VALUE
+
+
+def test_cache_value_compressed_without_zstandard(monkeypatch):
+    """A compressed entry read without zstandard is a ValueError (treated as a miss)."""
+    monkeypatch.setattr(redis_utils, "_zstd_decompress", None)
+
+    with pytest.raises(ValueError):
+        redis_utils._decode_cache_value(redis_utils._ZSTD_MAGIC + b"\x00\x00")
+
+
+def test_cache_value_corrupt_frame():
+    """A truncated zstd frame raises ValueError rather than a zstandard error."""
+    if redis_utils._zstd_compress is None:
+        pytest.skip("zstandard not installed")
+    data = redis_utils._encode_cache_value(_LARGE_VALUE)
+
+    with pytest.raises(ValueError):
+        redis_utils._decode_cache_value(data[:20])
+
+
+@pytest.fixture
+def cache_client(mock_redis, monkeypatch):
+    monkeypatch.setattr(redis_utils, "_cache_client", mock_redis)
+    monkeypatch.setattr(redis_utils, "_LOCAL", {})
+    monkeypatch.setattr(redis_utils, "_BREAKER", {"failures": 0, "open_until": 0.0})
+    mock_redis.set.return_value = True
+    return mock_redis
+
+
+def _stamped(value, age, compute_seconds=0.0):
+    data = redis_utils._encode_cache_value(
+        {"v": value, "ts": redis_utils.time.time() - age, "d": compute_seconds}
+    )
+    return data.encode() if isinstance(data, str) else data
+
+
+def test_mget_and_touch_serves_fresh_entries(cache_client):
+    """Fresh entries are served, their TTL reset with GETEX, and no lock is taken."""
+    _pipe(cache_client).execute.return_value = [_stamped("sunny", age=10), None]
+
+    values, refresh = redis_utils.cache_mget_and_touch({"w": 600, "g": 900}, max_age_seconds=100)
+
+    assert values == {"w": "sunny", "g": None}
+    assert refresh == set()
+    _pipe(cache_client).execute_command.assert_any_call("GETEX", "w", "EX", 600, NEVER_DECODE=True)
+    cache_client.set.assert_not_called()
+
+
+def test_mget_and_touch_expired_entry_lock_winner_refreshes(cache_client):
+    """Past max age, the caller that wins the lock refreshes and gets no stale value."""
+    _pipe(cache_client).execute.return_value = [_stamped("sunny", age=200)]
+
+    values, refresh = redis_utils.cache_mget_and_touch({"w": 600}, max_age_seconds=100)
+
+    assert values == {"w": None}
+    assert refresh == {"w"}
+    cache_client.set.assert_called_once_with(
+        "cache:lock:w", 1, nx=True, ex=redis_utils.REFRESH_LOCK_SECONDS
+    )
+
+
+def test_mget_and_touch_lock_loser_keeps_serving(cache_client):
+    """While another worker holds the refresh lock, the current value is served."""
+    cache_client.set.return_value = None
+    _pipe(cache_client).execute.return_value = [_stamped("sunny", age=200)]
+
+    values, refresh = redis_utils.cache_mget_and_touch({"w": 600}, max_age_seconds=100)
+
+    assert values == {"w": "sunny"}
+    assert refresh == set()
+
+
+def test_mget_and_touch_early_refresh(cache_client, monkeypatch):
+    """XFetch: a slow-to-compute entry is refreshed before max age, still served meanwhile."""
+    _pipe(cache_client).execute.return_value = [_stamped("sunny", age=90, compute_seconds=5.0)]
+    # -ln(1 - 0.9) * 5s ~= 11.5s of headroom: 90 + 11.5 >= 100
+    monkeypatch.setattr(redis_utils.random, "random", lambda: 0.9)
+
+    values, refresh = redis_utils.cache_mget_and_touch({"w": 600}, max_age_seconds=100)
+
+    assert values == {"w": "sunny"}
+    assert refresh == {"w"}
+
+
+def test_mget_and_touch_unstamped_entry_is_a_miss(cache_client):
+    """Entries without the {"v", "ts"} stamp are treated as missing, not refreshed."""
+    _pipe(cache_client).execute.return_value = [b'"plain value"']
+
+    values, refresh = redis_utils.cache_mget_and_touch({"w": 600}, max_age_seconds=100)
+
+    assert values == {"w": None}
+    assert refresh == set()
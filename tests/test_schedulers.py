@@ -0,0 +1,63 @@
+import datetime
+
+import pytest
+
+pytz = pytest.importorskip("pytz")
+pytest.importorskip("asyncpg")
+pytest.importorskip("telegram")
+
+from tests.helpers import load_module
+
+worker_brief = load_module("worker_brief_main", "workers", "worker-brief", "main.py")
+
+SEOUL = pytz.timezone("Asia/Seoul")
+
+
+def _seoul(*args):
+    return SEOUL.localize(datetime.datetime(*args))
+
+
+@pytest.mark.parametrize("after, expected", [
+    (_seoul(2026, 1, 26, 7, 0), _seoul(2026, 1, 26, 10, 0)),
+    (_seoul(2026, 1, 26, 10, 0), _seoul(2026, 1, 26, 22, 0)),   # slot itself is not "after"
+    (_seoul(2026, 1, 26, 15, 30), _seoul(2026, 1, 26, 22, 0)),
+    (_seoul(2026, 1, 26, 22, 0), _seoul(2026, 1, 27, 10, 0)),
+    (_seoul(2026, 12, 31, 23, 59), _seoul(2027, 1, 1, 10, 0)),
+])
+def test_next_briefing_run(after, expected):
+    """Next briefing slot is the earliest of BRIEFING_TIMES strictly after `after`."""
+    assert worker_brief._next_run(after, SEOUL) == expected
+
+
+def test_next_briefing_run_across_dst():
+    """Slots stay at local wall-clock time across a DST change."""
+    ny = pytz.timezone("America/New_York")
+    after = ny.localize(datetime.datetime(2026, 3, 7, 23, 0))  # DST starts 2026-03-08
+
+    run = worker_brief._next_run(after, ny)
+
+    assert run.replace(tzinfo=None) == datetime.datetime(2026, 3, 8, 10, 0)
+    assert run.utcoffset() == datetime.timedelta(hours=-4)
+
+
+@pytest.fixture(scope="module")
+def worker_coach():
+    pytest.importorskip("httpx")
+    pytest.importorskip("psycopg_pool")
+    return load_module("worker_coach_main", "workers", "worker-coach", "main.py")
+
+
+def _local(worker_coach, *args):
+    return pytz.timezone(worker_coach.TZ).localize(datetime.datetime(*args))
+
+
+@pytest.mark.parametrize("after, expected", [
+    ((2026, 1, 21, 9, 0), (2026, 1, 25, 23, 0)),    # Wednesday -> this Sunday
+    ((2026, 1, 25, 22, 59), (2026, 1, 25, 23, 0)),  # Sunday before the slot
+    ((2026, 1, 25, 23, 0), (2026, 2, 1, 23, 0)),    # the slot itself -> next week
+    ((2026, 1, 26, 0, 0), (2026, 2, 1, 23, 0)),     # Monday
+])
+def test_next_draft_run(worker_coach, after, expected):
+    """Weekly draft runs Sunday 23:00 local time, strictly after `after`."""
+    run = worker_coach._next_draft_run(_local(worker_coach, *after))
+    assert run == _local(worker_coach, *expected)
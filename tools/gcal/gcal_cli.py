@@ -30,17 +30,51 @@ Examples:
   # delete by matching (time window + summary keyword)
   GCAL_SA_JSON=... GCAL_CALENDAR_ID=... \
     python tools/gcal/gcal_cli.py delete --when "내일 10:00" --summary-contains "치과" --days 2
+
+  # several matches are refused unless --force, which deletes ALL of them
+  # (exit code 1 if any single delete fails)
+  GCAL_SA_JSON=... GCAL_CALENDAR_ID=... \
+    python tools/gcal/gcal_cli.py delete --when "내일 10:00" --summary-contains "치과" --force
 """
 
 from __future__ import annotations
 
 import argparse
 import datetime as dt
+import functools
+import importlib.util
 import os
 import sys
 from typing import Optional, Any
 
 
+def _lazy_import(name: str):
+    """Import a module lazily: its body only runs on first attribute access."""
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}")
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+# googleapiclient.discovery pulls in a large import graph (~100ms); defer it until
+# _build_service actually touches it so --help / arg errors stay fast.
+try:
+    service_account = _lazy_import("google.oauth2.service_account")
+    _discovery = _lazy_import("googleapiclient.discovery")
+
+    _GOOGLE_IMPORT_ERROR: Optional[Exception] = None
+except Exception as e:  # pragma: no cover - depends on local install
+    _GOOGLE_IMPORT_ERROR = e
+
+# Retries for transient 5xx/429 on idempotent API calls (backoff handled by googleapiclient)
+_NUM_RETRIES = 3
+
+
 def _die(msg: str, code: int = 2) -> None:
     print(msg, file=sys.stderr)
     raise SystemExit(code)
@@ -57,28 +91,33 @@ def _local_tz_name() -> str:
     return os.getenv("TZ", "Asia/Seoul")
 
 
+_REL_DAYS = {
+    "오늘": 0,
+    "내일": 1,
+    "모레": 2,
+}
+
+
 def _parse_when_korean(s: str, tz: dt.tzinfo) -> dt.datetime:
     """Parse minimal Korean relative datetime strings.
 
     Supported patterns:
       - "오늘 10:00", "내일 9", "모레 18:30"
       - "2026-01-30 14:00"
+      - any ISO 8601 string accepted by datetime.fromisoformat (e.g. "2026-01-30T14:00+09:00")
 
     For anything else, we fall back to dateutil (if installed).
+    Results are memoized per (input, tz, today) so repeated --when values are parsed once.
     """
+    today = dt.datetime.now(tz).date()
+    return _parse_when_cached(s.strip(), tz, today)
 
-    s = s.strip()
-    now = dt.datetime.now(tz)
-
-    rel_days = {
-        "오늘": 0,
-        "내일": 1,
-        "모레": 2,
-    }
 
+@functools.lru_cache(maxsize=128)
+def _parse_when_cached(s: str, tz: dt.tzinfo, today: dt.date) -> dt.datetime:
     parts = s.split()
-    if len(parts) == 2 and parts[0] in rel_days:
-        day = (now.date() + dt.timedelta(days=rel_days[parts[0]]))
+    if len(parts) == 2 and parts[0] in _REL_DAYS:
+        day = (today + dt.timedelta(days=_REL_DAYS[parts[0]]))
         hm = parts[1]
         if ":" in hm:
             hh, mm = hm.split(":", 1)
@@ -86,6 +125,15 @@ def _parse_when_korean(s: str, tz: dt.tzinfo) -> dt.datetime:
             hh, mm = hm, "00"
         return dt.datetime.combine(day, dt.time(int(hh), int(mm)), tz)
 
+    # ISO 8601 fast path (much cheaper than dateutil)
+    try:
+        parsed = dt.datetime.fromisoformat(s.replace("Z", "+00:00"))
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=tz)
+        return parsed
+    except ValueError:
+        pass
+
     # ISO-ish fallback
     try:
         # Accept "YYYY-MM-DD HH:MM" or "YYYY-MM-DDTHH:MM"
@@ -111,25 +159,38 @@ def _parse_when_korean(s: str, tz: dt.tzinfo) -> dt.datetime:
         )
 
 
+def _die_missing_deps(err: Exception) -> None:
+    _die(
+        "Missing Google API deps. Install as:\n"
+        "  sudo apt-get update\n"
+        "  sudo apt-get install -y python3-pip python3-venv\n"
+        "  python3 -m venv .venv && . .venv/bin/activate\n"
+        "  pip install -U google-api-python-client google-auth google-auth-httplib2 python-dateutil\n"
+        f"(detail: {err})"
+    )
+
+
+@functools.lru_cache(maxsize=None)
 def _build_service(sa_json_path: str):
+    if _GOOGLE_IMPORT_ERROR is not None:
+        _die_missing_deps(_GOOGLE_IMPORT_ERROR)
+
+    # First attribute access runs the lazily loaded modules: a missing transitive
+    # dependency (e.g. google-auth-httplib2) only surfaces here.
     try:
-        from google.oauth2 import service_account  # type: ignore
-        from googleapiclient.discovery import build  # type: ignore
-    except Exception as e:
-        _die(
-            "Missing Google API deps. Install as:\n"
-            "  sudo apt-get update\n"
-            "  sudo apt-get install -y python3-pip python3-venv\n"
-            "  python3 -m venv .venv && . .venv/bin/activate\n"
-            "  pip install -U google-api-python-client google-auth google-auth-httplib2 python-dateutil\n"
-            f"(detail: {e})"
-        )
+        credentials = service_account.Credentials
+        build = _discovery.build
+    except ImportError as e:
+        _die_missing_deps(e)
 
     scopes = ["https://www.googleapis.com/auth/calendar"]
-    creds = service_account.Credentials.from_service_account_file(sa_json_path, scopes=scopes)
-    return build("calendar", "v3", credentials=creds, cache_discovery=False)
+    creds = credentials.from_service_account_file(sa_json_path, scopes=scopes)
+    # Use the discovery document bundled with google-api-python-client (>= 2.0)
+    # instead of fetching it over the network on every CLI run.
+    return build("calendar", "v3", credentials=creds, cache_discovery=False, static_discovery=True)
 
 
+@functools.lru_cache(maxsize=None)
 def _get_tz():
     tz_name = _local_tz_name()
     try:
@@ -163,8 +224,10 @@ def _list_events(service: Any, cal_id: str, *, start: dt.datetime, end: dt.datet
                 singleEvents=True,
                 orderBy="startTime",
                 pageToken=page_token,
+                # partial response: only the fields cmd_list/cmd_delete read
+                fields="nextPageToken,items(id,summary,start,end)",
             )
-            .execute()
+            .execute(num_retries=_NUM_RETRIES)
         )
         items = resp.get("items", [])
         out.extend(items)
@@ -216,6 +279,7 @@ def cmd_create(args: argparse.Namespace) -> None:
     }
 
     service = _build_service(sa_json)
+    # No automatic retries: insert is not idempotent and a retried 5xx could create duplicates.
     created = service.events().insert(calendarId=cal_id, body=body).execute()
 
     # Print both id and link for downstream tooling
@@ -227,6 +291,39 @@ def cmd_create(args: argparse.Namespace) -> None:
         print(link)
 
 
+# Google batch endpoint accepts at most 50 calls per multipart request
+_BATCH_LIMIT = 50
+
+
+def _delete_batch(service: Any, cal_id: str, events: list[dict]) -> None:
+    """Delete several events with one HTTP round-trip per _BATCH_LIMIT calls."""
+    failed: list[str] = []
+
+    def on_done(request_id: str, _response: Any, exception: Optional[Exception]) -> None:
+        ev = by_id[request_id]
+        if exception is not None:
+            failed.append(request_id)
+            print(f"failed id={request_id} ({exception})", file=sys.stderr)
+            return
+        start_s, end_s = _event_time_str(ev)
+        print(f"deleted id={request_id}")
+        print(f"- {start_s} ~ {end_s} | {ev.get('summary','')}")
+
+    by_id = {ev["id"]: ev for ev in events if ev.get("id")}
+    ids = list(by_id)
+    if not ids:
+        _die("Matched events have no id; cannot delete.")
+
+    for i in range(0, len(ids), _BATCH_LIMIT):
+        batch = service.new_batch_http_request(callback=on_done)
+        for ev_id in ids[i:i + _BATCH_LIMIT]:
+            batch.add(service.events().delete(calendarId=cal_id, eventId=ev_id), request_id=ev_id)
+        batch.execute()
+
+    if failed:
+        _die(f"{len(failed)} of {len(ids)} deletes failed.", 1)
+
+
 def cmd_delete(args: argparse.Namespace) -> None:
     sa_json = _require_env("GCAL_SA_JSON")
     cal_id = _require_env("GCAL_CALENDAR_ID")
@@ -236,7 +333,7 @@ def cmd_delete(args: argparse.Namespace) -> None:
 
     # Fast path: delete by id
     if args.event_id:
-        service.events().delete(calendarId=cal_id, eventId=args.event_id).execute()
+        service.events().delete(calendarId=cal_id, eventId=args.event_id).execute(num_retries=_NUM_RETRIES)
         print(f"deleted id={args.event_id}")
         return
 
@@ -252,9 +349,12 @@ def cmd_delete(args: argparse.Namespace) -> None:
 
     items = _list_events(service, cal_id, start=start, end=end, limit=int(args.limit))
 
+    target_ts = int(target_start.timestamp())
+    needle = args.summary_contains
+
     def matches(ev: dict) -> bool:
-        summary = (ev.get("summary") or "").strip()
-        if args.summary_contains not in summary:
+        summary = ev.get("summary") or ""
+        if needle not in summary:
             return False
         start_s, _ = _event_time_str(ev)
         if not start_s:
@@ -267,23 +367,27 @@ def cmd_delete(args: argparse.Namespace) -> None:
         except Exception:
             return False
         # strict match: same minute
-        return abs(int((ev_start - target_start).total_seconds())) < 60
+        return abs(int(ev_start.timestamp()) - target_ts) < 60
 
     candidates = [ev for ev in items if matches(ev)]
     if not candidates:
         _die("No matching event found to delete. Try widening --days or adjust --when.", 3)
     if len(candidates) > 1 and not args.force:
         _die(
-            f"Multiple ({len(candidates)}) matching events found. Re-run with --force or delete by --event-id.",
+            f"Multiple ({len(candidates)}) matching events found. Re-run with --force to delete all of them, or delete by --event-id.",
             3,
         )
 
+    if len(candidates) > 1:
+        _delete_batch(service, cal_id, candidates)
+        return
+
     ev = candidates[0]
     ev_id = ev.get("id")
     if not ev_id:
         _die("Matched event has no id; cannot delete.")
 
-    service.events().delete(calendarId=cal_id, eventId=ev_id).execute()
+    service.events().delete(calendarId=cal_id, eventId=ev_id).execute(num_retries=_NUM_RETRIES)
     start_s, end_s = _event_time_str(ev)
     print(f"deleted id={ev_id}")
     print(f"- {start_s} ~ {end_s} | {ev.get('summary','')}")
@@ -313,7 +417,7 @@ def main(argv: Optional[list[str]] = None) -> int:
     p_del.add_argument("--summary-contains", help="substring match on summary")
     p_del.add_argument("--days", type=int, default=7, help="search window in days starting today")
     p_del.add_argument("--limit", type=int, default=50, help="max events to scan")
-    p_del.add_argument("--force", action="store_true", help="allow delete when multiple matches")
+    p_del.add_argument("--force", action="store_true", help="when several events match, delete ALL of them")
     p_del.set_defaults(fn=cmd_delete)
 
     args = p.parse_args(argv)
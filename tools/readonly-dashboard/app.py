@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import os
-from datetime import datetime
+import time
+from contextlib import asynccontextmanager
 
-import psycopg2
+from psycopg.conninfo import make_conninfo
+from psycopg_pool import ConnectionPool
 from fastapi import FastAPI
 from fastapi.responses import HTMLResponse
 
@@ -14,61 +16,63 @@ POSTGRES_PASSWORD = os.getenv("POSTGRES_PASSWORD", "password")
 
 APP_TITLE = os.getenv("RO_DASH_TITLE", "custom-ai-bot (read-only)")
 
-app = FastAPI(title=APP_TITLE)
-
-
-def get_conn():
-    return psycopg2.connect(
+# psycopg3 pool (thread-safe; sync endpoints run in FastAPI's threadpool).
+# Opened/closed with the app lifespan so requests never pay the connect handshake.
+pool = ConnectionPool(
+    conninfo=make_conninfo(
         host=POSTGRES_HOST,
-        database=POSTGRES_DB,
+        dbname=POSTGRES_DB,
         user=POSTGRES_USER,
         password=POSTGRES_PASSWORD,
-    )
-
-
-@app.get("/health")
-def health():
-    return {"ok": True, "ts": datetime.utcnow().isoformat() + "Z"}
-
-
-@app.get("/", response_class=HTMLResponse)
-def index():
-    # Very small read-only dashboard: latest updates + row counts.
-    conn = get_conn()
-    cur = conn.cursor()
-
-    cur.execute("SELECT COUNT(*) FROM health_daily")
-    health_rows = cur.fetchone()[0]
-    cur.execute("SELECT MAX(date) FROM health_daily")
-    health_latest = cur.fetchone()[0]
-
-    cur.execute("SELECT COUNT(*) FROM exercise_activity")
-    act_rows = cur.fetchone()[0]
-    cur.execute("SELECT MAX(start_time) FROM exercise_activity")
-    act_latest = cur.fetchone()[0]
+    ),
+    min_size=1,
+    max_size=4,
+    open=False,
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    pool.open()
+    try:
+        yield
+    finally:
+        pool.close()
+
+
+app = FastAPI(title=APP_TITLE, lifespan=lifespan)
+
+
+# All row counts + latest timestamps in a single round-trip.
+SUMMARY_SQL = """
+SELECT
+  (SELECT COUNT(*) FROM health_daily),
+  (SELECT MAX(date) FROM health_daily),
+  (SELECT COUNT(*) FROM exercise_activity),
+  (SELECT MAX(start_time) FROM exercise_activity),
+  (SELECT COUNT(*) FROM training_plan_weekly),
+  (SELECT MAX(week_start) FROM training_plan_weekly),
+  (SELECT COUNT(*) FROM training_plan_day),
+  (SELECT MAX(plan_date) FROM training_plan_day),
+  (SELECT COUNT(*) FROM terminal_command_log),
+  (SELECT MAX(ts) FROM terminal_command_log)
+"""
 
-    cur.execute("SELECT COUNT(*) FROM training_plan_weekly")
-    planw_rows = cur.fetchone()[0]
-    cur.execute("SELECT MAX(week_start) FROM training_plan_weekly")
-    planw_latest = cur.fetchone()[0]
 
-    cur.execute("SELECT COUNT(*) FROM training_plan_day")
-    pland_rows = cur.fetchone()[0]
-    cur.execute("SELECT MAX(plan_date) FROM training_plan_day")
-    pland_latest = cur.fetchone()[0]
+# [epoch second, formatted UTC timestamp] — reformatted at most once per second.
+_HEALTH_CACHE: list = [0, ""]
 
-    cur.execute("SELECT COUNT(*) FROM terminal_command_log")
-    audit_rows = cur.fetchone()[0]
-    cur.execute("SELECT MAX(ts) FROM terminal_command_log")
-    audit_latest = cur.fetchone()[0]
 
-    cur.close()
-    conn.close()
+@app.get("/health")
+def health():
+    now = int(time.time())
+    if now != _HEALTH_CACHE[0]:
+        _HEALTH_CACHE[:] = [now, time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))]
+    return {"ok": True, "ts": _HEALTH_CACHE[1]}
 
-    def fmt(x):
-        return "-" if x is None else str(x)
 
-    html = f"""
+# Static page parts are built once at import; only the table rows change per request.
+_HTML_HEAD = f"""
 <!doctype html>
 <html lang=\"en\">
 <head>
@@ -91,15 +95,37 @@ def index():
 
   <table>
     <tr><th>Dataset</th><th>Rows</th><th>Latest</th></tr>
-    <tr><td>health_daily</td><td>{health_rows}</td><td>{fmt(health_latest)}</td></tr>
-    <tr><td>exercise_activity</td><td>{act_rows}</td><td>{fmt(act_latest)}</td></tr>
-    <tr><td>training_plan_weekly</td><td>{planw_rows}</td><td>{fmt(planw_latest)}</td></tr>
-    <tr><td>training_plan_day</td><td>{pland_rows}</td><td>{fmt(pland_latest)}</td></tr>
-    <tr><td>terminal_command_log</td><td>{audit_rows}</td><td>{fmt(audit_latest)}</td></tr>
-  </table>
+"""
+_HTML_TAIL = """  </table>
 
   <p class=\"muted\">Health check: <code>/health</code></p>
 </body>
 </html>
 """
-    return HTMLResponse(html)
+_ROW_TMPL = "    <tr><td>{n}</td><td>{r}</td><td>{l}</td></tr>\n"
+
+# Same order as the (count, latest) pairs returned by SUMMARY_SQL.
+_DATASETS = (
+    "health_daily",
+    "exercise_activity",
+    "training_plan_weekly",
+    "training_plan_day",
+    "terminal_command_log",
+)
+
+
+@app.get("/", response_class=HTMLResponse)
+def index():
+    # Very small read-only dashboard: latest updates + row counts.
+    # Read-only; pool.connection() ends the transaction when the block exits.
+    with pool.connection() as conn:
+        summary = conn.execute(SUMMARY_SQL).fetchone()
+
+    def fmt(x):
+        return "-" if x is None else str(x)
+
+    rows = "".join(
+        _ROW_TMPL.format(n=name, r=summary[2 * i], l=fmt(summary[2 * i + 1]))
+        for i, name in enumerate(_DATASETS)
+    )
+    return HTMLResponse(_HTML_HEAD + rows + _HTML_TAIL)
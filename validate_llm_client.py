@@ -2,10 +2,30 @@
 """Validation script for LLM Client implementation."""
 
 import ast
+import os
 import sys
+import mmap
+import functools
 from pathlib import Path
 
 
+def _parse_file(path: Path) -> ast.Module:
+    """Parse a source file, reusing the tree while the file is unchanged."""
+    return _parse_cached(str(path), os.path.getmtime(path))
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_cached(path: str, mtime: float) -> ast.Module:
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            source = b""
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                source = mm[:]
+    # compile() accepts bytes directly and honours any encoding declaration
+    return compile(source, path, "exec", ast.PyCF_ONLY_AST)
+
+
 def validate_llm_client():
     """Validate LLM client implementation structure."""
     print("=== LLM Client Implementation Validation ===\n")
@@ -19,16 +39,20 @@ def validate_llm_client():
     print(f"✓ File exists: {client_path}")
 
     # Parse the file
-    with open(client_path, "r") as f:
-        content = f.read()
-        tree = ast.parse(content)
+    tree = _parse_file(client_path)
 
-    # Find LLMClient class
+    # Single pass over the module: find LLMClient and collect imports
     llm_class = None
+    imports = set()
     for node in ast.walk(tree):
-        if isinstance(node, ast.ClassDef) and node.name == "LLMClient":
-            llm_class = node
-            break
+        if isinstance(node, ast.ClassDef):
+            if llm_class is None and node.name == "LLMClient":
+                llm_class = node
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                imports.add(alias.name)
+        elif isinstance(node, ast.ImportFrom):
+            imports.add(node.module or "")
 
     if not llm_class:
         print("❌ LLMClient class not found")
@@ -47,10 +71,20 @@ def validate_llm_client():
         "count_tokens": "Token counting",
     }
 
+    # Single pass over the class body: methods, async methods, class attributes
     found_methods = set()
+    async_methods = set()
+    class_attrs = set()
     for node in llm_class.body:
-        if isinstance(node, ast.FunctionDef) or isinstance(node, ast.AsyncFunctionDef):
+        if isinstance(node, ast.AsyncFunctionDef):
             found_methods.add(node.name)
+            async_methods.add(node.name)
+        elif isinstance(node, ast.FunctionDef):
+            found_methods.add(node.name)
+        elif isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    class_attrs.add(target.id)
 
     print("\nMethod Validation:")
     all_methods_found = True
@@ -63,13 +97,6 @@ def validate_llm_client():
 
     # Check class attributes
     print("\nClass Attributes:")
-    class_attrs = set()
-    for node in llm_class.body:
-        if isinstance(node, ast.Assign):
-            for target in node.targets:
-                if isinstance(target, ast.Name):
-                    class_attrs.add(target.id)
-
     required_attrs = {"MODEL_MAP", "OPENAI_MODEL_MAP"}
     for attr in required_attrs:
         if attr in class_attrs:
@@ -80,14 +107,6 @@ def validate_llm_client():
 
     # Check imports
     print("\nImport Validation:")
-    imports = set()
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Import):
-            for alias in node.names:
-                imports.add(alias.name)
-        elif isinstance(node, ast.ImportFrom):
-            imports.add(node.module or "")
-
     required_imports = ["anthropic", "logging", "os", "typing"]
     for imp in required_imports:
         if any(imp in i for i in imports):
@@ -97,11 +116,6 @@ def validate_llm_client():
 
     # Check async methods
     print("\nAsync Method Validation:")
-    async_methods = set()
-    for node in llm_class.body:
-        if isinstance(node, ast.AsyncFunctionDef):
-            async_methods.add(node.name)
-
     required_async = ["chat", "_chat_claude", "_chat_openai", "count_tokens"]
     for method in required_async:
         if method in async_methods:
@@ -137,9 +151,7 @@ def validate_tests():
 
     print(f"✓ Test file exists: {test_path}")
 
-    with open(test_path, "r") as f:
-        content = f.read()
-        tree = ast.parse(content)
+    tree = _parse_file(test_path)
 
     # Count test methods
     test_methods = []
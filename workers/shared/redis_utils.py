@@ -2,28 +2,157 @@
 Redis Utilities for Clawd Bot
 - Caching
 - Rate Limiting
-- Job Queue
+- Job Queue (Redis Streams)
 """
 
 import os
 import json
+import math
+import time
+import random
+import socket
 import logging
+import threading
 import functools
 import hashlib
+import inspect
 from typing import Any, Optional, Callable
 from datetime import timedelta
 import redis
 
 logger = logging.getLogger('clawd.redis')
 
+# JSON (de)serialization: prefer orjson (C extension) and fall back to stdlib json.
+# Values decode the same as with json.dumps(value, default=str): datetimes go through str(), not RFC 3339.
+# orjson output stays as bytes: redis-py writes bytes as-is, skipping a decode/re-encode.
+try:
+    import orjson
+
+    _ORJSON_OPTS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+    def _dumps(value: Any) -> bytes:
+        return orjson.dumps(value, default=str, option=_ORJSON_OPTS)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(value: Any) -> str:
+        return json.dumps(value, default=str)
+
+    _loads = json.loads
+
+# Non-cryptographic digest for cache keys: blake3 (SIMD) if installed, else hashlib.blake2b
+try:
+    from blake3 import blake3 as _hasher
+except ImportError:
+    _hasher = hashlib.blake2b
+
+
+# Cache payload compression: values above COMPRESS_MIN_BYTES are stored zstd-compressed.
+# zstd frames start with a fixed magic number that no JSON document can start with, so
+# cache reads need no extra framing and plain entries written before this stay readable.
+COMPRESS_MIN_BYTES = 1024
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+try:
+    import zstandard
+
+    _zstd_compress = zstandard.ZstdCompressor(level=3).compress
+    _zstd_decompress = zstandard.ZstdDecompressor().decompress
+except ImportError:
+    _zstd_compress = None
+    _zstd_decompress = None
+
+
+def _encode_cache_value(value: Any):
+    data = _dumps(value)
+    if _zstd_compress is not None and len(data) > COMPRESS_MIN_BYTES:
+        if isinstance(data, str):
+            data = data.encode()
+        return _zstd_compress(data)
+    return data
+
+
+def _decode_cache_value(data: bytes) -> Any:
+    if data[:4] == _ZSTD_MAGIC:
+        if _zstd_decompress is None:
+            raise ValueError("compressed cache entry but zstandard is not installed")
+        try:
+            data = _zstd_decompress(data)
+        except zstandard.ZstdError as e:
+            raise ValueError(f"corrupt compressed cache entry: {e}") from e
+    return _loads(data)
+
+
+def _key_digest(data: str) -> str:
+    """Short hex digest used to shorten long cache keys."""
+    return _hasher(data.encode()).hexdigest()[:16]
+
+
 # Environment Variables
 REDIS_HOST = os.getenv("REDIS_HOST", "redis")
 REDIS_PORT = int(os.getenv("REDIS_PORT", "6379"))
 REDIS_DB = int(os.getenv("REDIS_DB", "0"))
 REDIS_PASSWORD = os.getenv("REDIS_PASSWORD")
-
-# Global Redis client
+REDIS_POOL_SIZE = int(os.getenv("REDIS_POOL", "32"))
+REDIS_POOL_TIMEOUT = float(os.getenv("REDIS_POOL_TIMEOUT", "5"))
+# TCP keepalive keeps idle pooled sockets alive through NAT/conntrack timeouts;
+# health checks PING a connection idle longer than the interval before reusing it.
+REDIS_SOCKET_KEEPALIVE = os.getenv("REDIS_SOCKET_KEEPALIVE", "1") != "0"
+REDIS_HEALTH_CHECK_INTERVAL = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "30"))
+# Cache reads/writes are optional speedups: they use their own client with short timeouts
+# and fail open (miss / no-op) instead of stalling the caller.
+REDIS_CACHE_TIMEOUT = float(os.getenv("REDIS_CACHE_TIMEOUT", "0.1"))
+REDIS_CACHE_CONNECT_TIMEOUT = float(os.getenv("REDIS_CACHE_CONNECT_TIMEOUT", "0.2"))
+
+# Global Redis client. Hot paths read it directly (`_redis_client or get_redis_client()`)
+# so the lock/function call is only paid until the first connection is set up.
 _redis_client: Optional[redis.Redis] = None
+_cache_client: Optional[redis.Redis] = None
+_init_lock = threading.Lock()
+
+
+def _keepalive_options() -> dict:
+    """Probe idle sockets after 60s, every 10s, drop after 3 misses (where the OS supports it)."""
+    opts = {}
+    for name, value in (("TCP_KEEPIDLE", 60), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3)):
+        if hasattr(socket, name):
+            opts[getattr(socket, name)] = value
+    return opts
+
+
+def _build_client(
+    socket_timeout: float = 5,
+    connect_timeout: float = 5,
+    pool_timeout: Optional[float] = None,
+    retry_on_timeout: bool = True
+) -> redis.Redis:
+    # redis-py picks the C hiredis parser automatically when it is installed.
+    # Blocking pool: when all connections are busy, callers wait up to
+    # REDIS_POOL_TIMEOUT seconds and then fail instead of opening more sockets.
+    pool = redis.BlockingConnectionPool(
+        host=REDIS_HOST,
+        port=REDIS_PORT,
+        db=REDIS_DB,
+        password=REDIS_PASSWORD,
+        decode_responses=True,
+        socket_timeout=socket_timeout,
+        socket_connect_timeout=connect_timeout,
+        socket_keepalive=REDIS_SOCKET_KEEPALIVE,
+        socket_keepalive_options=_keepalive_options() if REDIS_SOCKET_KEEPALIVE else None,
+        health_check_interval=REDIS_HEALTH_CHECK_INTERVAL,
+        retry_on_timeout=retry_on_timeout,
+        max_connections=REDIS_POOL_SIZE,
+        timeout=REDIS_POOL_TIMEOUT if pool_timeout is None else pool_timeout
+    )
+    return redis.Redis(connection_pool=pool)
+
+
+def _build_cache_client() -> redis.Redis:
+    return _build_client(
+        socket_timeout=REDIS_CACHE_TIMEOUT,
+        connect_timeout=REDIS_CACHE_CONNECT_TIMEOUT,
+        pool_timeout=REDIS_CACHE_CONNECT_TIMEOUT,
+        retry_on_timeout=False
+    )
 
 
 def get_redis_client() -> redis.Redis:
@@ -31,34 +160,114 @@ def get_redis_client() -> redis.Redis:
     global _redis_client
     
     if _redis_client is None:
-        _redis_client = redis.Redis(
-            host=REDIS_HOST,
-            port=REDIS_PORT,
-            db=REDIS_DB,
-            password=REDIS_PASSWORD,
-            decode_responses=True,
-            socket_timeout=5,
-            socket_connect_timeout=5,
-            retry_on_timeout=True
-        )
+        with _init_lock:
+            if _redis_client is None:
+                _redis_client = _build_client()
+    
+    return _redis_client
+
+
+def get_cache_client() -> redis.Redis:
+    """Get or create the short-timeout client used by the cache helpers."""
+    global _cache_client
+    
+    if _cache_client is None:
+        with _init_lock:
+            if _cache_client is None:
+                _cache_client = _build_cache_client()
+    
+    return _cache_client
+
+
+def configure_redis(
+    pool_size: Optional[int] = None,
+    socket_keepalive: Optional[bool] = None,
+    health_check_interval: Optional[int] = None
+) -> redis.Redis:
+    """
+    Override connection settings (defaults come from env) and rebuild the shared client.
+    
+    Size the pool to at least the number of threads/tasks that use Redis at once.
+    """
+    global _redis_client, _cache_client
+    global REDIS_POOL_SIZE, REDIS_SOCKET_KEEPALIVE, REDIS_HEALTH_CHECK_INTERVAL
+    
+    with _init_lock:
+        if pool_size is not None:
+            REDIS_POOL_SIZE = pool_size
+        if socket_keepalive is not None:
+            REDIS_SOCKET_KEEPALIVE = socket_keepalive
+        if health_check_interval is not None:
+            REDIS_HEALTH_CHECK_INTERVAL = health_check_interval
+        
+        old, _redis_client = _redis_client, _build_client()
+        old_cache, _cache_client = _cache_client, None
+        # Scripts are bound to the client they were registered on
+        _SCRIPTS.clear()
     
+    for client in (old, old_cache):
+        if client is not None:
+            client.connection_pool.disconnect()
     return _redis_client
 
 
+# Availability probe result is reused for a short window so bursts share one PING
+AVAILABILITY_TTL_SECONDS = 2.0
+_AVAIL_CACHE = {"ts": 0.0, "ok": False}
+
+
 def is_redis_available() -> bool:
-    """Check if Redis is available."""
+    """Check if Redis is available (cached for AVAILABILITY_TTL_SECONDS)."""
+    now = time.monotonic()
+    if _AVAIL_CACHE["ts"] and now - _AVAIL_CACHE["ts"] < AVAILABILITY_TTL_SECONDS:
+        return _AVAIL_CACHE["ok"]
+    if _cache_circuit_open():
+        return False
+
     try:
-        client = get_redis_client()
-        return client.ping()
+        client = _cache_client or get_cache_client()
+        ok = bool(client.ping())
+        _cache_succeeded()
     except (redis.ConnectionError, redis.TimeoutError) as e:
         logger.warning(f"Redis not available: {e}")
-        return False
+        _cache_failed()
+        ok = False
+
+    _AVAIL_CACHE["ts"] = now
+    _AVAIL_CACHE["ok"] = ok
+    return ok
 
 
 # =============================================================================
 # Caching
 # =============================================================================
 
+# Keys longer than this (e.g. many/large decorator args) are replaced by prefix + digest
+MAX_CACHE_KEY_LENGTH = 200
+
+# Circuit breaker: after CACHE_BREAKER_FAILURES consecutive Redis errors, cache helpers
+# skip Redis entirely (miss / no-op) for CACHE_BREAKER_COOLDOWN_SECONDS.
+CACHE_BREAKER_FAILURES = 3
+CACHE_BREAKER_COOLDOWN_SECONDS = 30.0
+_BREAKER = {"failures": 0, "open_until": 0.0}
+
+
+def _cache_circuit_open() -> bool:
+    return _BREAKER["open_until"] > time.monotonic()
+
+
+def _cache_succeeded() -> None:
+    _BREAKER["failures"] = 0
+
+
+def _cache_failed() -> None:
+    _BREAKER["failures"] += 1
+    if _BREAKER["failures"] >= CACHE_BREAKER_FAILURES:
+        _BREAKER["failures"] = 0
+        _BREAKER["open_until"] = time.monotonic() + CACHE_BREAKER_COOLDOWN_SECONDS
+        logger.warning(f"Redis cache disabled for {CACHE_BREAKER_COOLDOWN_SECONDS:.0f}s after repeated errors")
+
+
 class CacheKeys:
     """Cache key prefixes."""
     WEATHER = "cache:weather"
@@ -68,42 +277,238 @@ class CacheKeys:
     GARMIN_ACTIVITIES = "cache:garmin:activities"
 
 
+# In-process TTL cache in front of Redis: repeated reads of a key within
+# LOCAL_CACHE_TTL_SECONDS skip the round trip. Kept well under Redis TTLs so staleness is bounded.
+LOCAL_CACHE_TTL_SECONDS = 15.0
+LOCAL_CACHE_MAX_ITEMS = 2048
+_LOCAL: dict = {}  # key -> (expires_at, value)
+_local_lock = threading.Lock()
+
+
+def _local_get(key: str) -> Optional[Any]:
+    with _local_lock:
+        entry = _LOCAL.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del _LOCAL[key]
+            return None
+        return entry[1]
+
+
+def _local_put(key: str, value: Any) -> None:
+    with _local_lock:
+        if key not in _LOCAL and len(_LOCAL) >= LOCAL_CACHE_MAX_ITEMS:
+            # dicts keep insertion order: drop the oldest entry
+            del _LOCAL[next(iter(_LOCAL))]
+        _LOCAL[key] = (time.monotonic() + LOCAL_CACHE_TTL_SECONDS, value)
+
+
+def _local_drop(*keys: str) -> None:
+    with _local_lock:
+        for key in keys:
+            _LOCAL.pop(key, None)
+
+
 def cache_get(key: str) -> Optional[Any]:
     """Get value from cache."""
+    value = _local_get(key)
+    if value is not None or _cache_circuit_open():
+        return value
+    
     try:
-        client = get_redis_client()
-        data = client.get(key)
+        client = _cache_client or get_cache_client()
+        # Raw bytes: the client decodes responses to str, which compressed entries are not
+        data = client.execute_command("GET", key, NEVER_DECODE=True)
+        _cache_succeeded()
         if data:
-            return json.loads(data)
+            value = _decode_cache_value(data)
+            _local_put(key, value)
+            return value
         return None
-    except (redis.RedisError, json.JSONDecodeError) as e:
+    except redis.RedisError as e:
+        logger.error(f"Cache get error for {key}: {e}")
+        _cache_failed()
+        return None
+    except ValueError as e:
         logger.error(f"Cache get error for {key}: {e}")
         return None
 
 
 def cache_set(key: str, value: Any, ttl_seconds: int = 300) -> bool:
     """Set value in cache with TTL."""
+    _local_drop(key)
+    if _cache_circuit_open():
+        return False
     try:
-        client = get_redis_client()
-        data = json.dumps(value, default=str)
+        client = _cache_client or get_cache_client()
+        data = _encode_cache_value(value)
         client.setex(key, ttl_seconds, data)
+        _cache_succeeded()
         return True
     except redis.RedisError as e:
         logger.error(f"Cache set error for {key}: {e}")
+        _cache_failed()
+        return False
+
+
+def cache_mget(keys: list) -> dict:
+    """Get several cache values in one round trip (missing keys map to None)."""
+    out = {k: _local_get(k) for k in keys}
+    missing = [k for k, v in out.items() if v is None]
+    if not missing or _cache_circuit_open():
+        return out
+    
+    try:
+        client = _cache_client or get_cache_client()
+        raw = client.execute_command("MGET", *missing, NEVER_DECODE=True)
+        _cache_succeeded()
+        for k, v in zip(missing, raw):
+            if v:
+                out[k] = _decode_cache_value(v)
+                _local_put(k, out[k])
+        return out
+    except redis.RedisError as e:
+        logger.error(f"Cache mget error for {missing}: {e}")
+        _cache_failed()
+        return out
+    except ValueError as e:
+        logger.error(f"Cache mget error for {missing}: {e}")
+        return out
+
+
+def cache_mset(mapping: dict, ttl_seconds: int = 300) -> bool:
+    """Set several values with the same TTL in one round trip."""
+    _local_drop(*mapping)
+    if _cache_circuit_open():
+        return False
+    try:
+        client = _cache_client or get_cache_client()
+        with client.pipeline(transaction=False) as pipe:
+            for key, value in mapping.items():
+                pipe.setex(key, ttl_seconds, _encode_cache_value(value))
+            pipe.execute()
+        _cache_succeeded()
+        return True
+    except redis.RedisError as e:
+        logger.error(f"Cache mset error for {list(mapping)}: {e}")
+        _cache_failed()
         return False
 
 
+# Stamped entries wrap the value with its creation time and how long it took to compute:
+# {"v": value, "ts": epoch seconds, "d": compute seconds}
+REFRESH_LOCK_SECONDS = 30
+
+
+def cache_set_stamped(key: str, value: Any, ttl_seconds: int = 300, compute_seconds: float = 0.0) -> bool:
+    """Set value with a creation timestamp (read back with cache_mget_and_touch)."""
+    return cache_set(key, {"v": value, "ts": time.time(), "d": compute_seconds}, ttl_seconds)
+
+
+def cache_mget_and_touch(
+    ttl_by_key: dict,
+    max_age_seconds: Optional[float] = None,
+    early_refresh_beta: float = 1.0
+) -> tuple:
+    """
+    Get stamped values and reset each key's TTL (GETEX), all in one round trip.
+    
+    Sliding expiry keeps frequently read entries warm; max_age_seconds (by the
+    stamp) bounds how old a served value can get. Returns (values, refresh_keys).
+    
+    Stampede protection: as an entry nears max age it becomes due for refresh
+    probabilistically (XFetch: earlier for slower-to-compute values), and only
+    the caller that wins the `cache:lock:<key>` SET NX gets the key in
+    refresh_keys. Everyone else keeps serving the current value meanwhile.
+    Missing keys are always None in values and never in refresh_keys.
+    """
+    keys = list(ttl_by_key)
+    out = dict.fromkeys(keys)
+    refresh = set()
+    if _cache_circuit_open():
+        return out, refresh
+    try:
+        client = _cache_client or get_cache_client()
+        with client.pipeline(transaction=False) as pipe:
+            for key, ttl in ttl_by_key.items():
+                pipe.execute_command("GETEX", key, "EX", ttl, NEVER_DECODE=True)
+            raw = pipe.execute()
+        _cache_succeeded()
+    except redis.RedisError as e:
+        logger.error(f"Cache mget-and-touch error for {keys}: {e}")
+        _cache_failed()
+        return out, refresh
+    
+    now = time.time()
+    for key, data in zip(keys, raw):
+        if not data:
+            continue
+        try:
+            entry = _decode_cache_value(data)
+            value, age = entry["v"], now - entry["ts"]
+        except (ValueError, KeyError, TypeError):
+            # Corrupt or unstamped (pre-existing) entry: treat as a miss
+            continue
+        
+        if max_age_seconds is None:
+            out[key] = value
+            continue
+        
+        # XFetch: -ln(U) is exponentially distributed, so refreshes spread out before expiry
+        delta = entry.get("d") or 0.0
+        due = age - delta * early_refresh_beta * math.log(1.0 - random.random()) >= max_age_seconds
+        if not due:
+            out[key] = value
+        elif _try_refresh_lock(client, key):
+            refresh.add(key)
+            if age <= max_age_seconds:
+                out[key] = value
+        else:
+            # Another worker is refreshing: serve what we have until it lands
+            out[key] = value
+    return out, refresh
+
+
+def _try_refresh_lock(client: redis.Redis, key: str) -> bool:
+    try:
+        return bool(client.set(f"cache:lock:{key}", 1, nx=True, ex=REFRESH_LOCK_SECONDS))
+    except redis.RedisError:
+        _cache_failed()
+        return True
+
+
 def cache_delete(key: str) -> bool:
     """Delete key from cache."""
+    _local_drop(key)
+    if _cache_circuit_open():
+        return False
     try:
-        client = get_redis_client()
+        client = _cache_client or get_cache_client()
         client.delete(key)
+        _cache_succeeded()
         return True
     except redis.RedisError as e:
         logger.error(f"Cache delete error for {key}: {e}")
+        _cache_failed()
         return False
 
 
+def _make_key(key_prefix: str, args: tuple, kwargs: dict) -> str:
+    """Build a cache key from function arguments; long keys become prefix + digest."""
+    if not args and not kwargs:
+        return key_prefix
+    
+    cache_key = ":".join((
+        key_prefix,
+        *map(str, args),
+        *(f"{k}={v}" for k, v in sorted(kwargs.items())),
+    ))
+    if len(cache_key) > MAX_CACHE_KEY_LENGTH:
+        cache_key = f"{key_prefix}:{_key_digest(cache_key)}"
+    return cache_key
+
+
 def cached(key_prefix: str, ttl_seconds: int = 300):
     """
     Decorator for caching function results.
@@ -116,14 +521,7 @@ def cached(key_prefix: str, ttl_seconds: int = 300):
     def decorator(func: Callable):
         @functools.wraps(func)
         async def async_wrapper(*args, **kwargs):
-            # Build cache key from function arguments
-            key_parts = [key_prefix]
-            if args:
-                key_parts.extend(str(a) for a in args)
-            if kwargs:
-                key_parts.extend(f"{k}={v}" for k, v in sorted(kwargs.items()))
-            
-            cache_key = ":".join(key_parts)
+            cache_key = _make_key(key_prefix, args, kwargs)
             
             # Try to get from cache
             cached_value = cache_get(cache_key)
@@ -141,13 +539,7 @@ def cached(key_prefix: str, ttl_seconds: int = 300):
         
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs):
-            key_parts = [key_prefix]
-            if args:
-                key_parts.extend(str(a) for a in args)
-            if kwargs:
-                key_parts.extend(f"{k}={v}" for k, v in sorted(kwargs.items()))
-            
-            cache_key = ":".join(key_parts)
+            cache_key = _make_key(key_prefix, args, kwargs)
             
             cached_value = cache_get(cache_key)
             if cached_value is not None:
@@ -161,10 +553,8 @@ def cached(key_prefix: str, ttl_seconds: int = 300):
             
             return result
         
-        # Return appropriate wrapper based on function type
-        if hasattr(func, '__code__') and func.__code__.co_flags & 0x80:  # CO_COROUTINE
-            return async_wrapper
-        return sync_wrapper
+        # Return appropriate wrapper based on function type (decided once per decoration)
+        return async_wrapper if inspect.iscoroutinefunction(func) else sync_wrapper
     
     return decorator
 
@@ -173,6 +563,54 @@ def cached(key_prefix: str, ttl_seconds: int = 300):
 # Rate Limiting
 # =============================================================================
 
+RATE_LIMIT_LUA = """
+local key = KEYS[1]
+local seq_key = KEYS[2]
+local max_requests = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+
+-- Remove old entries
+redis.call('ZREMRANGEBYSCORE', key, 0, now - window * 1000)
+
+-- Count current requests
+local count = redis.call('ZCARD', key)
+
+if count < max_requests then
+    -- Add new request; a per-limiter counter gives short, unique integer members
+    local seq = redis.call('INCR', seq_key)
+    redis.call('ZADD', key, now, seq)
+    redis.call('EXPIRE', key, window)
+    redis.call('EXPIRE', seq_key, window)
+    return 1
+else
+    return 0
+end
+"""
+
+REMAINING_LUA = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, ARGV[1])
+return redis.call('ZCARD', KEYS[1])
+"""
+
+OLDEST_LUA = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, ARGV[1])
+local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+return oldest[2]
+"""
+
+# Registered scripts keyed by source. redis-py's Script sends EVALSHA and
+# transparently re-loads the source on NOSCRIPT (e.g. after a Redis restart).
+_SCRIPTS: dict = {}
+
+
+def _get_script(source: str):
+    script = _SCRIPTS.get(source)
+    if script is None:
+        script = _SCRIPTS[source] = (_redis_client or get_redis_client()).register_script(source)
+    return script
+
+
 class RateLimiter:
     """
     Token bucket rate limiter using Redis.
@@ -190,45 +628,17 @@ class RateLimiter:
         self.max_requests = max_requests
         self.window_seconds = window_seconds
         self.key = f"ratelimit:{name}"
+        self.seq_key = f"ratelimit:{name}:seq"
     
     def allow(self) -> bool:
         """Check if request is allowed and consume a token."""
         try:
-            client = get_redis_client()
-            
-            # Use a Lua script for atomic operation
-            lua_script = """
-            local key = KEYS[1]
-            local max_requests = tonumber(ARGV[1])
-            local window = tonumber(ARGV[2])
-            local now = tonumber(ARGV[3])
-            
-            -- Remove old entries
-            redis.call('ZREMRANGEBYSCORE', key, 0, now - window * 1000)
-            
-            -- Count current requests
-            local count = redis.call('ZCARD', key)
-            
-            if count < max_requests then
-                -- Add new request
-                redis.call('ZADD', key, now, now .. '-' .. math.random())
-                redis.call('EXPIRE', key, window)
-                return 1
-            else
-                return 0
-            end
-            """
-            
-            import time
             now_ms = int(time.time() * 1000)
             
-            result = client.eval(
-                lua_script,
-                1,
-                self.key,
-                self.max_requests,
-                self.window_seconds,
-                now_ms
+            # Atomic check-and-consume; sent as EVALSHA once the script is cached server-side
+            result = _get_script(RATE_LIMIT_LUA)(
+                keys=[self.key, self.seq_key],
+                args=[self.max_requests, self.window_seconds, now_ms]
             )
             
             return bool(result)
@@ -241,16 +651,12 @@ class RateLimiter:
     def remaining(self) -> int:
         """Get remaining requests in current window."""
         try:
-            client = get_redis_client()
-            import time
-            now_ms = int(time.time() * 1000)
-            window_start = now_ms - (self.window_seconds * 1000)
+            window_start = int(time.time() * 1000) - (self.window_seconds * 1000)
             
-            # Remove old and count
-            client.zremrangebyscore(self.key, 0, window_start)
-            count = client.zcard(self.key)
+            # Remove old and count in one atomic round trip
+            count = _get_script(REMAINING_LUA)(keys=[self.key], args=[window_start])
             
-            return max(0, self.max_requests - count)
+            return max(0, self.max_requests - int(count))
             
         except redis.RedisError:
             return self.max_requests
@@ -258,18 +664,15 @@ class RateLimiter:
     def wait_time(self) -> float:
         """Get seconds to wait before next request is allowed."""
         try:
-            client = get_redis_client()
+            now_ms = time.time() * 1000
+            window_start = int(now_ms) - (self.window_seconds * 1000)
             
-            # Get oldest entry
-            oldest = client.zrange(self.key, 0, 0, withscores=True)
-            if not oldest:
+            # Oldest entry after trimming expired ones
+            oldest_ms = _get_script(OLDEST_LUA)(keys=[self.key], args=[window_start])
+            if not oldest_ms:
                 return 0
             
-            import time
-            oldest_ms = oldest[0][1]
-            now_ms = time.time() * 1000
-            
-            wait_ms = (oldest_ms + self.window_seconds * 1000) - now_ms
+            wait_ms = (float(oldest_ms) + self.window_seconds * 1000) - now_ms
             return max(0, wait_ms / 1000)
             
         except redis.RedisError:
@@ -286,26 +689,59 @@ github_limiter = RateLimiter("github_api", max_requests=30, window_seconds=60)
 # Job Queue
 # =============================================================================
 
+# Popped jobs carry their stream entry id under this key (used by complete()/fail())
+JOB_ID_KEY = "__id"
+
+# Consumer group shared by every worker reading a queue
+DEFAULT_GROUP = "workers"
+
+# Delivered jobs not acknowledged within this window are handed to another consumer
+JOB_VISIBILITY_TIMEOUT_SECONDS = 300
+
+
 class JobQueue:
     """
-    Simple job queue using Redis lists.
+    Job queue using a Redis Stream with a consumer group.
+    
+    Entries stay in the group's pending list until acknowledged; once idle
+    longer than `visibility_timeout` (e.g. the worker died mid-job) they are
+    re-delivered by the next pop.
     
     Usage:
         queue = JobQueue("sync_tasks")
         queue.push({"task": "sync_garmin", "date": "2026-01-26"})
         job = queue.pop()
+        queue.complete(job)
     """
     
-    def __init__(self, name: str):
+    def __init__(self, name: str, group: str = DEFAULT_GROUP, consumer: Optional[str] = None,
+                 visibility_timeout: int = JOB_VISIBILITY_TIMEOUT_SECONDS):
         self.name = name
         self.key = f"queue:{name}"
-        self.processing_key = f"queue:{name}:processing"
+        self.failed_key = f"queue:{name}:failed"
+        self.group = group
+        self.consumer = consumer or f"{socket.gethostname()}-{os.getpid()}"
+        self.visibility_ms = visibility_timeout * 1000
+        self._group_ready = False
+        self._next_reclaim = 0.0
+    
+    def _ensure_group(self, client: redis.Redis) -> None:
+        """Create the stream and consumer group once (XGROUP CREATE ... MKSTREAM)."""
+        if self._group_ready:
+            return
+        try:
+            client.xgroup_create(self.key, self.group, id="0", mkstream=True)
+        except redis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+        self._group_ready = True
     
     def push(self, job: dict) -> bool:
         """Add job to queue."""
         try:
-            client = get_redis_client()
-            client.lpush(self.key, json.dumps(job, default=str))
+            client = _redis_client or get_redis_client()
+            self._ensure_group(client)
+            client.xadd(self.key, {"data": _dumps(job)})
             logger.info(f"Job pushed to {self.name}: {job}")
             return True
         except redis.RedisError as e:
@@ -319,64 +755,119 @@ class JobQueue:
         Args:
             timeout: Seconds to wait for job (0 = no wait)
         """
+        jobs = self.pop_batch(1, timeout)
+        return jobs[0] if jobs else None
+    
+    def pop_batch(self, count: int, timeout: int = 0) -> list:
+        """
+        Get up to `count` jobs from queue in one round trip (XREADGROUP).
+        
+        Args:
+            count: Maximum number of jobs to take
+            timeout: Seconds to wait for the first job (0 = no wait)
+        """
         try:
-            client = get_redis_client()
+            client = _redis_client or get_redis_client()
+            self._ensure_group(client)
             
-            if timeout > 0:
-                # Blocking pop with timeout
-                result = client.brpoplpush(self.key, self.processing_key, timeout)
-            else:
-                # Non-blocking pop
-                result = client.rpoplpush(self.key, self.processing_key)
+            # Expired reservations first (checked at most once per visibility window)
+            entries = self._reclaim_stale(client, count)
             
-            if result:
-                return json.loads(result)
-            return None
+            if len(entries) < count:
+                result = client.xreadgroup(
+                    self.group,
+                    self.consumer,
+                    {self.key: ">"},
+                    count=count - len(entries),
+                    block=None if entries or timeout <= 0 else timeout * 1000
+                )
+                # result = [[stream, [(entry_id, {"data": payload}), ...]]]
+                if result:
+                    entries.extend(result[0][1])
+            
+            jobs = []
+            for entry_id, fields in entries:
+                job = _loads(fields["data"])
+                job[JOB_ID_KEY] = entry_id
+                jobs.append(job)
+            return jobs
             
         except redis.RedisError as e:
             logger.error(f"Failed to pop job: {e}")
-            return None
+            return []
+    
+    def _reclaim_stale(self, client: redis.Redis, count: int) -> list:
+        """Claim pending entries idle longer than the visibility timeout (XAUTOCLAIM)."""
+        now = time.monotonic()
+        if now < self._next_reclaim:
+            return []
+        
+        _next_id, claimed, *_ = client.xautoclaim(
+            self.key, self.group, self.consumer, self.visibility_ms, start_id="0-0", count=count
+        )
+        if len(claimed) < count:
+            # Nothing more is stale right now; look again after one visibility window
+            self._next_reclaim = now + self.visibility_ms / 1000
+        
+        # Entries deleted while pending come back without fields on Redis 6.2
+        stale = [(entry_id, fields) for entry_id, fields in claimed if fields]
+        if stale:
+            logger.warning(f"Reclaimed {len(stale)} stale job(s) on {self.name}")
+        return stale
     
     def complete(self, job: dict) -> bool:
-        """Mark job as completed (remove from processing)."""
+        """Mark job as completed (acknowledge and drop the entry)."""
         try:
-            client = get_redis_client()
-            client.lrem(self.processing_key, 1, json.dumps(job, default=str))
+            client = _redis_client or get_redis_client()
+            entry_id = job[JOB_ID_KEY]
+            with client.pipeline(transaction=True) as pipe:
+                pipe.xack(self.key, self.group, entry_id)
+                pipe.xdel(self.key, entry_id)
+                pipe.execute()
             return True
-        except redis.RedisError as e:
+        except (redis.RedisError, KeyError) as e:
             logger.error(f"Failed to complete job: {e}")
             return False
     
     def fail(self, job: dict, error: str) -> bool:
         """Mark job as failed and store for retry/inspection."""
         try:
-            client = get_redis_client()
-            
-            # Remove from processing
-            client.lrem(self.processing_key, 1, json.dumps(job, default=str))
+            client = _redis_client or get_redis_client()
+            entry_id = job[JOB_ID_KEY]
+            failed_job = {k: v for k, v in job.items() if k != JOB_ID_KEY}
+            failed_job["error"] = error
+            failed_job["failed_at"] = str(datetime.datetime.now())
             
-            # Add to failed queue with error info
-            failed_job = {**job, "error": error, "failed_at": str(datetime.datetime.now())}
-            client.lpush(f"{self.key}:failed", json.dumps(failed_job, default=str))
+            # Acknowledge and move to the failed stream atomically, in one round trip
+            with client.pipeline(transaction=True) as pipe:
+                pipe.xack(self.key, self.group, entry_id)
+                pipe.xdel(self.key, entry_id)
+                pipe.xadd(self.failed_key, {"data": _dumps(failed_job)})
+                pipe.execute()
             
             return True
-        except redis.RedisError as e:
+        except (redis.RedisError, KeyError) as e:
             logger.error(f"Failed to mark job as failed: {e}")
             return False
     
     def size(self) -> int:
-        """Get queue size."""
+        """Get number of jobs waiting to be delivered."""
         try:
-            client = get_redis_client()
-            return client.llen(self.key)
+            client = _redis_client or get_redis_client()
+            # Completed entries are deleted, so the stream holds waiting + pending
+            with client.pipeline(transaction=False) as pipe:
+                pipe.xlen(self.key)
+                pipe.xpending(self.key, self.group)
+                length, pending = pipe.execute()
+            return max(0, length - pending["pending"])
         except redis.RedisError:
             return 0
     
     def processing_count(self) -> int:
-        """Get number of jobs being processed."""
+        """Get number of jobs being processed (delivered but not acknowledged)."""
         try:
-            client = get_redis_client()
-            return client.llen(self.processing_key)
+            client = _redis_client or get_redis_client()
+            return client.xpending(self.key, self.group)["pending"]
         except redis.RedisError:
             return 0
 
@@ -393,15 +884,20 @@ notification_queue = JobQueue("notifications")
 def redis_health_check() -> dict:
     """Get Redis health status."""
     try:
-        client = get_redis_client()
+        client = _redis_client or get_redis_client()
         info = client.info()
         
+        pool = client.connection_pool
+        
         return {
             "status": "healthy",
             "connected_clients": info.get("connected_clients", 0),
             "used_memory_human": info.get("used_memory_human", "N/A"),
             "uptime_seconds": info.get("uptime_in_seconds", 0),
-            "total_commands_processed": info.get("total_commands_processed", 0)
+            "total_commands_processed": info.get("total_commands_processed", 0),
+            # Local pool: sockets opened so far vs. the cap
+            "pool_connections": len(getattr(pool, "_connections", ())),
+            "pool_max_connections": pool.max_connections
         }
     except redis.RedisError as e:
         return {
@@ -6,13 +6,27 @@ External Service Integrations for Worker Brief
 """
 
 import os
+import time
+import random
+import asyncio
 import logging
 import datetime
+import importlib.util
 from typing import Optional, List, Dict
 import httpx
 
 logger = logging.getLogger('worker-brief.external')
 
+# RFC 3339 parsing: ciso8601 (C extension) if installed, else datetime.fromisoformat
+try:
+    from ciso8601 import parse_rfc3339 as _parse_rfc3339
+except ImportError:
+    def _parse_rfc3339(s: str) -> datetime.datetime:
+        # Python < 3.11 fromisoformat does not accept a trailing "Z"
+        if s[-1:] == "Z":
+            s = s[:-1] + "+00:00"
+        return datetime.datetime.fromisoformat(s)
+
 # Environment Variables
 OPENWEATHER_API_KEY = os.getenv("OPENWEATHER_API_KEY")
 OPENWEATHER_CITY = os.getenv("OPENWEATHER_CITY", "Seoul")
@@ -24,12 +38,143 @@ GOOGLE_CALENDAR_ID = os.getenv("GOOGLE_CALENDAR_ID")
 GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
 GITHUB_USERNAME = os.getenv("GITHUB_USERNAME")
 
+# Endpoints and lookup tables, built once at import
+_WEATHER_URL = "https://api.openweathermap.org/data/2.5/weather"
+_WEATHER_PARAMS = {
+    "q": OPENWEATHER_CITY,
+    "appid": OPENWEATHER_API_KEY,
+    "units": OPENWEATHER_UNITS,
+    "lang": "kr"  # Korean descriptions
+}
+
+# Map weather condition to emoji
+_WEATHER_ICONS: Dict[str, str] = {
+    "01": "☀️",  # clear sky
+    "02": "🌤️",  # few clouds
+    "03": "☁️",  # scattered clouds
+    "04": "☁️",  # broken clouds
+    "09": "🌧️",  # shower rain
+    "10": "🌧️",  # rain
+    "11": "⛈️",  # thunderstorm
+    "13": "❄️",  # snow
+    "50": "🌫️",  # mist
+}
+
+_CALENDAR_URL = f"https://www.googleapis.com/calendar/v3/calendars/{GOOGLE_CALENDAR_ID}/events"
+
+_GITHUB_EVENTS_URL = f"https://api.github.com/users/{GITHUB_USERNAME}/events"
+_GITHUB_SEARCH_URL = "https://api.github.com/search/issues"
+_GITHUB_EVENTS_PARAMS = {"per_page": 30}
+_GITHUB_PRS_PARAMS = {
+    "q": f"author:{GITHUB_USERNAME} type:pr state:open",
+    "per_page": 10
+}
+
+# Reused by every GitHub request
+_GITHUB_HEADERS = {
+    "Authorization": f"token {GITHUB_TOKEN}",
+    "Accept": "application/vnd.github.v3+json"
+}
+
+
+# Persistent HTTP client: keep-alive (and HTTP/2 when `h2` is installed) across calls,
+# so warm requests skip the TCP+TLS handshake.
+_HTTP2 = importlib.util.find_spec("h2") is not None
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=40)
+_HTTP: Optional[httpx.AsyncClient] = None
+_HTTP_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Shared client for the running event loop (connections can't cross loops)."""
+    global _HTTP, _HTTP_LOOP
+    loop = asyncio.get_running_loop()
+    if _HTTP is None or _HTTP_LOOP is not loop:
+        _HTTP = httpx.AsyncClient(http2=_HTTP2, timeout=15.0, limits=_HTTP_LIMITS)
+        _HTTP_LOOP = loop
+    return _HTTP
+
+
+async def close_http_client() -> None:
+    """Close the shared client; call before its event loop shuts down."""
+    global _HTTP, _HTTP_LOOP
+    if _HTTP is not None:
+        client, _HTTP, _HTTP_LOOP = _HTTP, None, None
+        await client.aclose()
+
+
+# Upstream rate-limit feedback: when a response says the quota is spent
+# (X-RateLimit-Remaining: 0 or HTTP 429), skip that service until it resets.
+RATE_LIMIT_DEFAULT_BACKOFF_SECONDS = 60
+_BLOCKED_UNTIL: Dict[str, float] = {}
+
+
+def _note_rate_limit(service: str, response: httpx.Response) -> None:
+    headers = response.headers
+    if response.status_code != 429 and headers.get("X-RateLimit-Remaining") != "0":
+        return
+    
+    until = time.time() + RATE_LIMIT_DEFAULT_BACKOFF_SECONDS
+    try:
+        if "Retry-After" in headers:
+            until = time.time() + float(headers["Retry-After"])
+        elif "X-RateLimit-Reset" in headers:  # GitHub: epoch seconds
+            until = float(headers["X-RateLimit-Reset"])
+    except ValueError:
+        pass
+    
+    _BLOCKED_UNTIL[service] = until
+    logger.warning(f"{service} rate limit reached; pausing until {datetime.datetime.fromtimestamp(until)}")
+
+
+def _rate_limited(service: str) -> bool:
+    return _BLOCKED_UNTIL.get(service, 0) > time.time()
+
+
+# Transient failures (connection errors, 5xx) are retried with jittered exponential
+# backoff. Always asyncio.sleep: a time.sleep here would freeze the whole event loop.
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY_SECONDS = 0.5
+
+
+async def _get_with_retry(http: httpx.AsyncClient, url: str, **kwargs) -> httpx.Response:
+    delay = RETRY_BASE_DELAY_SECONDS
+    for attempt in range(1, RETRY_ATTEMPTS + 1):
+        try:
+            response = await http.get(url, **kwargs)
+            if response.status_code < 500 or attempt == RETRY_ATTEMPTS:
+                return response
+            logger.warning(f"GET {url} -> {response.status_code}, retrying ({attempt}/{RETRY_ATTEMPTS})")
+        except httpx.TransportError as e:
+            if attempt == RETRY_ATTEMPTS:
+                raise
+            logger.warning(f"GET {url} failed: {e!r}, retrying ({attempt}/{RETRY_ATTEMPTS})")
+        await asyncio.sleep(delay + random.uniform(0, delay))
+        delay *= 2
+
+
+async def gather_cancel_on_error(*coros):
+    """Like asyncio.gather, but the first failure (or our own cancellation) cancels the rest."""
+    tasks = [asyncio.create_task(c) for c in coros]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        pending = [t for t in tasks if not t.done()]
+        for t in pending:
+            t.cancel()
+        if pending:
+            await asyncio.wait(pending)
+    for t in done:
+        if t.exception() is not None:
+            raise t.exception()
+    return [t.result() for t in tasks]
+
 
 # =============================================================================
 # Weather API (OpenWeatherMap)
 # =============================================================================
 
-async def get_weather() -> Optional[Dict]:
+async def get_weather(client: Optional[httpx.AsyncClient] = None) -> Optional[Dict]:
     """
     Fetch current weather from OpenWeatherMap API.
     
@@ -48,36 +193,18 @@ async def get_weather() -> Optional[Dict]:
     if not OPENWEATHER_API_KEY:
         logger.warning("OPENWEATHER_API_KEY not configured")
         return None
+    if _rate_limited("weather"):
+        return None
     
     try:
-        url = "https://api.openweathermap.org/data/2.5/weather"
-        params = {
-            "q": OPENWEATHER_CITY,
-            "appid": OPENWEATHER_API_KEY,
-            "units": OPENWEATHER_UNITS,
-            "lang": "kr"  # Korean descriptions
-        }
-        
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-        
-        # Map weather condition to emoji
-        weather_icons = {
-            "01": "☀️",  # clear sky
-            "02": "🌤️",  # few clouds
-            "03": "☁️",  # scattered clouds
-            "04": "☁️",  # broken clouds
-            "09": "🌧️",  # shower rain
-            "10": "🌧️",  # rain
-            "11": "⛈️",  # thunderstorm
-            "13": "❄️",  # snow
-            "50": "🌫️",  # mist
-        }
+        http = client or get_http_client()
+        response = await _get_with_retry(http, _WEATHER_URL, params=_WEATHER_PARAMS, timeout=10.0)
+        _note_rate_limit("weather", response)
+        response.raise_for_status()
+        data = response.json()
         
         icon_code = data["weather"][0]["icon"][:2]
-        weather_emoji = weather_icons.get(icon_code, "🌡️")
+        weather_emoji = _WEATHER_ICONS.get(icon_code, "🌡️")
         
         return {
             "temp": round(data["main"]["temp"], 1),
@@ -104,20 +231,19 @@ def format_weather(weather: Optional[Dict]) -> str:
     if not weather:
         return "🌡️ 날씨 정보 없음"
     
-    lines = [
-        f"{weather['icon']} *{weather['city']}*: {weather['description']}",
-        f"  🌡️ 현재 {weather['temp']}°C (체감 {weather['feels_like']}°C)",
-        f"  📊 최저 {weather['temp_min']}°C / 최고 {weather['temp_max']}°C",
+    return (
+        f"{weather['icon']} *{weather['city']}*: {weather['description']}\n"
+        f"  🌡️ 현재 {weather['temp']}°C (체감 {weather['feels_like']}°C)\n"
+        f"  📊 최저 {weather['temp_min']}°C / 최고 {weather['temp_max']}°C\n"
         f"  💧 습도 {weather['humidity']}% | 💨 바람 {weather['wind_speed']}m/s"
-    ]
-    return "\n".join(lines)
+    )
 
 
 # =============================================================================
 # Google Calendar API
 # =============================================================================
 
-async def get_calendar_events(max_results: int = 5) -> List[Dict]:
+async def get_calendar_events(max_results: int = 5, client: Optional[httpx.AsyncClient] = None) -> List[Dict]:
     """
     Fetch today's events from Google Calendar.
     
@@ -147,7 +273,6 @@ async def get_calendar_events(max_results: int = 5) -> List[Dict]:
         time_min = datetime.datetime.combine(today, datetime.time.min).isoformat() + "Z"
         time_max = datetime.datetime.combine(today, datetime.time.max).isoformat() + "Z"
         
-        url = f"https://www.googleapis.com/calendar/v3/calendars/{GOOGLE_CALENDAR_ID}/events"
         params = {
             "key": GOOGLE_CALENDAR_API_KEY,
             "timeMin": time_min,
@@ -157,10 +282,10 @@ async def get_calendar_events(max_results: int = 5) -> List[Dict]:
             "orderBy": "startTime"
         }
         
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+        http = client or get_http_client()
+        response = await _get_with_retry(http, _CALENDAR_URL, params=params, timeout=10.0)
+        response.raise_for_status()
+        data = response.json()
         
         events = []
         for item in data.get("items", []):
@@ -174,10 +299,8 @@ async def get_calendar_events(max_results: int = 5) -> List[Dict]:
                 start_str = "종일"
                 end_str = ""
             else:
-                start_dt = datetime.datetime.fromisoformat(start.get("dateTime", "").replace("Z", "+00:00"))
-                end_dt = datetime.datetime.fromisoformat(end.get("dateTime", "").replace("Z", "+00:00"))
-                start_str = start_dt.strftime("%H:%M")
-                end_str = end_dt.strftime("%H:%M")
+                start_str = _parse_rfc3339(start.get("dateTime", "")).strftime("%H:%M")
+                end_str = _parse_rfc3339(end.get("dateTime", "")).strftime("%H:%M")
             
             events.append({
                 "summary": item.get("summary", "제목 없음"),
@@ -197,29 +320,29 @@ async def get_calendar_events(max_results: int = 5) -> List[Dict]:
         return []
 
 
+def _format_calendar_line(event: Dict) -> str:
+    if event["all_day"]:
+        time_str = "🗓️ 종일"
+    else:
+        time_str = f"⏰ {event['start']}-{event['end']}"
+    
+    location = f" 📍 {event['location']}" if event["location"] else ""
+    return f"  {time_str} {event['summary']}{location}"
+
+
 def format_calendar_events(events: List[Dict]) -> str:
     """Format calendar events for briefing message."""
     if not events:
         return "📆 오늘 일정 없음"
     
-    lines = ["📆 *오늘 일정*:"]
-    for event in events:
-        if event["all_day"]:
-            time_str = "🗓️ 종일"
-        else:
-            time_str = f"⏰ {event['start']}-{event['end']}"
-        
-        location = f" 📍 {event['location']}" if event["location"] else ""
-        lines.append(f"  {time_str} {event['summary']}{location}")
-    
-    return "\n".join(lines)
+    return "📆 *오늘 일정*:\n" + "\n".join(map(_format_calendar_line, events))
 
 
 # =============================================================================
 # GitHub API
 # =============================================================================
 
-async def get_github_activity() -> Dict:
+async def get_github_activity(client: Optional[httpx.AsyncClient] = None) -> Dict:
     """
     Fetch recent GitHub activity for the user.
     
@@ -235,43 +358,40 @@ async def get_github_activity() -> Dict:
     if not GITHUB_TOKEN or not GITHUB_USERNAME:
         logger.warning("GitHub not configured")
         return {}
+    if _rate_limited("github"):
+        return {}
     
     try:
-        headers = {
-            "Authorization": f"token {GITHUB_TOKEN}",
-            "Accept": "application/vnd.github.v3+json"
-        }
-        
         today = datetime.date.today()
         since = datetime.datetime.combine(today, datetime.time.min).isoformat() + "Z"
         
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            # Get user's events (commits, PRs, etc.)
-            events_url = f"https://api.github.com/users/{GITHUB_USERNAME}/events"
-            events_response = await client.get(events_url, headers=headers, params={"per_page": 30})
-            events_response.raise_for_status()
-            events = events_response.json()
-            
-            # Get open PRs created by user
-            prs_url = f"https://api.github.com/search/issues"
-            prs_params = {
-                "q": f"author:{GITHUB_USERNAME} type:pr state:open",
-                "per_page": 10
-            }
-            prs_response = await client.get(prs_url, headers=headers, params=prs_params)
-            prs_data = prs_response.json() if prs_response.status_code == 200 else {"total_count": 0}
+        http = client or get_http_client()
+        # User's events (commits, PRs, etc.) and open PRs created by user, concurrently
+        events_response, prs_response = await gather_cancel_on_error(
+            _get_with_retry(http, _GITHUB_EVENTS_URL, headers=_GITHUB_HEADERS, params=_GITHUB_EVENTS_PARAMS),
+            _get_with_retry(http, _GITHUB_SEARCH_URL, headers=_GITHUB_HEADERS, params=_GITHUB_PRS_PARAMS),
+        )
+        _note_rate_limit("github", events_response)
+        _note_rate_limit("github", prs_response)
+        events_response.raise_for_status()
+        events = events_response.json()
+        prs_data = prs_response.json() if prs_response.status_code == 200 else {"total_count": 0}
         
         # Count today's commits
         commits_today = 0
         repos_today = set()
         today_str = today.isoformat()
         
+        # Events are returned newest-first: stop at the first one before today
         for event in events:
-            event_date = event.get("created_at", "")[:10]
-            if event_date == today_str:
-                if event["type"] == "PushEvent":
-                    commits_today += len(event.get("payload", {}).get("commits", []))
-                    repos_today.add(event.get("repo", {}).get("name", "").split("/")[-1])
+            created_at = event.get("created_at", "")
+            if not created_at.startswith(today_str):
+                if created_at[:10] < today_str:
+                    break
+                continue
+            if event["type"] == "PushEvent":
+                commits_today += len(event.get("payload", {}).get("commits", []))
+                repos_today.add(event.get("repo", {}).get("name", "").split("/")[-1])
         
         return {
             "commits_today": commits_today,
@@ -4,8 +4,7 @@ import time
 import logging
 import datetime
 import asyncio
-import psycopg2
-import schedule
+import asyncpg
 import pytz
 from telegram import Bot
 
@@ -27,23 +26,29 @@ POSTGRES_DB = os.getenv("POSTGRES_DB", "clawd_db")
 POSTGRES_USER = os.getenv("POSTGRES_USER", "clawd_user")
 POSTGRES_PASSWORD = os.getenv("POSTGRES_PASSWORD", "password")
 TZ = os.getenv("TZ", "Asia/Seoul")
+_TZ = pytz.timezone(TZ)
 
 # Import external services
 try:
     from external_services import (
         get_weather, format_weather,
         get_calendar_events, format_calendar_events,
-        get_github_activity, format_github_activity
+        get_github_activity, format_github_activity,
+        get_http_client, close_http_client,
+        gather_cancel_on_error
     )
     EXTERNAL_SERVICES_AVAILABLE = True
 except ImportError as e:
     logger.warning(f"External services not available: {e}")
     EXTERNAL_SERVICES_AVAILABLE = False
+    # get_external_data() returns at once without the module, so nothing is left to cancel
+    gather_cancel_on_error = asyncio.gather
 
 # Import Redis utilities
 try:
     from redis_utils import (
         is_redis_available, cache_get, cache_set,
+        cache_mget_and_touch, cache_set_stamped,
         CacheKeys, weather_limiter, github_limiter
     )
     REDIS_AVAILABLE = True
@@ -52,105 +57,128 @@ except ImportError:
     logger.warning("Redis utilities not available")
 
 
-def get_db_connection():
-    return psycopg2.connect(
-        host=POSTGRES_HOST,
-        database=POSTGRES_DB,
-        user=POSTGRES_USER,
-        password=POSTGRES_PASSWORD
-    )
+# One asyncpg pool for the life of the event loop (closed by _shutdown_clients).
+# asyncpg prepares and caches each statement per connection on first use.
+_db_pool: asyncpg.Pool | None = None
 
 
-def _tz_today() -> datetime.date:
-    tz = pytz.timezone(TZ)
-    return datetime.datetime.now(tz).date()
+async def get_db_pool() -> asyncpg.Pool:
+    global _db_pool
+    if _db_pool is None:
+        _db_pool = await asyncpg.create_pool(
+            host=POSTGRES_HOST,
+            database=POSTGRES_DB,
+            user=POSTGRES_USER,
+            password=POSTGRES_PASSWORD,
+            min_size=1,
+            max_size=4
+        )
+    return _db_pool
 
 
-def get_health_data(today: datetime.date | None = None):
-    """Get latest health data from database.
+def _tz_today() -> datetime.date:
+    return datetime.datetime.now(_TZ).date()
+
+
+def _health_row(row) -> dict:
+    return {
+        'date': str(row[0]),
+        'sleep_hours': row[1],
+        'sleep_score': row[2],
+        'resting_hr': row[3],
+        'hrv_status': row[4],
+        'stress_level': row[5],
+        'body_battery_max': row[6],
+        'body_battery_min': row[7]
+    }
+
+
+# Activity rows arrive presentation-ready: display name, MM/DD date, "1h 5m" duration
+# and rounded distances are computed by Postgres. start_time is kept for ordering.
+ACTIVITY_COLUMNS = """
+    activity_type,
+    COALESCE(activity_name, activity_type),
+    start_time,
+    COALESCE(to_char(start_time, 'MM/DD'), ''),
+    CASE
+        WHEN COALESCE(duration_sec, 0) = 0 THEN 'N/A'
+        WHEN duration_sec >= 3600
+            THEN (duration_sec / 3600) || 'h ' || (mod(duration_sec, 3600) / 60) || 'm'
+        ELSE (duration_sec / 60) || 'm'
+    END,
+    round(COALESCE(distance_meters, 0) / 1000.0, 1),
+    round(COALESCE(distance_meters, 0)),
+    COALESCE(avg_pace, '')
+"""
+
+
+def _activity_row(row) -> dict:
+    return {
+        'type': row[0],
+        'name': row[1],
+        'start_time': row[2],
+        'date': row[3],
+        'duration': row[4],
+        'distance_km': row[5],
+        'distance_m': row[6],
+        'avg_pace': row[7]
+    }
+
+
+# Health rows for (today, yesterday) and the latest activities in one round trip.
+# Each branch NULL-pads the other's columns; the tag says which half a row uses.
+BRIEFING_DATA_SQL = f"""
+    (SELECT 'h' AS tag,
+            date, sleep_hours, sleep_score, resting_hr, hrv_status,
+            stress_level, body_battery_max, body_battery_min,
+            NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL
+     FROM health_daily
+     WHERE date IN ($1, $2))
+    UNION ALL
+    (SELECT 'a' AS tag,
+            NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL,
+            {ACTIVITY_COLUMNS}
+     FROM exercise_activity
+     ORDER BY start_time DESC
+     LIMIT $3)
+"""
+
+
+async def get_briefing_data(today: datetime.date | None = None, activity_limit=3):
+    """Get health rows keyed by date (today, yesterday) and recent activities in one query.
 
     Note:
     - Garmin sleep for "last night" is typically stored on *today's* date.
     - We compute dates in configured TZ (default Asia/Seoul) to avoid UTC drift.
     """
-    conn = get_db_connection()
-    cur = conn.cursor()
-
-    # Get today and yesterday's data (TZ-aware)
     today = today or _tz_today()
     yesterday = today - datetime.timedelta(days=1)
 
-    cur.execute("""
-        SELECT date, sleep_hours, sleep_score, resting_hr, hrv_status,
-               stress_level, body_battery_max, body_battery_min
-        FROM health_daily
-        WHERE date IN (%s, %s)
-        ORDER BY date DESC
-    """, (today, yesterday))
-
-    rows = cur.fetchall()
-    cur.close()
-    conn.close()
-
-    result = {}
-    for row in rows:
-        result[str(row[0])] = {
-            'date': str(row[0]),
-            'sleep_hours': row[1],
-            'sleep_score': row[2],
-            'resting_hr': row[3],
-            'hrv_status': row[4],
-            'stress_level': row[5],
-            'body_battery_max': row[6],
-            'body_battery_min': row[7]
-        }
-
-    return result
-
-
-def get_recent_activities(limit=3):
-    """Get recent exercise activities."""
-    conn = get_db_connection()
-    cur = conn.cursor()
-
-    cur.execute("""
-        SELECT activity_type, activity_name, start_time, duration_sec,
-               distance_meters, avg_hr, avg_pace, calories
-        FROM exercise_activity
-        ORDER BY start_time DESC
-        LIMIT %s
-    """, (limit,))
-
-    rows = cur.fetchall()
-    cur.close()
-    conn.close()
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        records = await conn.fetch(BRIEFING_DATA_SQL, today, yesterday, activity_limit)
 
+    health = {}
     activities = []
-    for row in rows:
-        activities.append({
-            'type': row[0],
-            'name': row[1],
-            'start_time': row[2],
-            'duration_sec': row[3],
-            'distance_meters': row[4],
-            'avg_hr': row[5],
-            'avg_pace': row[6],
-            'calories': row[7]
-        })
-
-    return activities
-
-
-def format_duration(seconds):
-    """Format duration in seconds to human readable."""
-    if not seconds:
-        return "N/A"
-    minutes = seconds // 60
-    if minutes >= 60:
-        hours = minutes // 60
-        mins = minutes % 60
-        return f"{hours}h {mins}m"
-    return f"{minutes}m"
+    for row in map(tuple, records):
+        if row[0] == 'h':
+            health[str(row[1])] = _health_row(row[1:9])
+        else:
+            activities.append(_activity_row(row[9:]))
+
+    # UNION ALL does not promise to keep the branch's ORDER BY
+    activities.sort(key=lambda a: a['start_time'] or datetime.datetime.min, reverse=True)
+    return health, activities
+
+
+# External data cache TTLs (seconds). Reads reset the TTL; the max age caps how long
+# a frequently read entry can be served before it is fetched again.
+WEATHER_CACHE_TTL = 1800  # 30 min
+GITHUB_CACHE_TTL = 900  # 15 min
+EXTERNAL_CACHE_MAX_AGE = 7200  # 2 h
+
+# Upper bound on the concurrent external fetches; slower services are cancelled and skipped
+EXTERNAL_FETCH_TIMEOUT = 5.0
 
 
 async def get_external_data():
@@ -162,56 +190,79 @@ async def get_external_data():
     if not EXTERNAL_SERVICES_AVAILABLE:
         return weather_data, calendar_events, github_activity
     
+    # One persistent HTTP client (and connection pool) for all three services
+    http = get_http_client()
     try:
         # Check rate limits and cache
         tasks = []
+        use_redis = REDIS_AVAILABLE and is_redis_available()
         
-        # Weather (with caching)
-        if REDIS_AVAILABLE and is_redis_available():
-            cached_weather = cache_get(CacheKeys.WEATHER)
+        # One round trip for every cached service; reads also extend the TTL (sliding expiry).
+        # `refresh` holds keys this worker won the right to re-fetch ahead of expiry.
+        cached, refresh = cache_mget_and_touch(
+            {CacheKeys.WEATHER: WEATHER_CACHE_TTL, CacheKeys.GITHUB: GITHUB_CACHE_TTL},
+            max_age_seconds=EXTERNAL_CACHE_MAX_AGE
+        ) if use_redis else ({}, set())
+        
+        # Weather (with caching; a cached value stays in use if the refresh fails)
+        if use_redis:
+            cached_weather = cached.get(CacheKeys.WEATHER)
             if cached_weather:
                 weather_data = cached_weather
-            elif weather_limiter.allow():
-                tasks.append(('weather', get_weather()))
+            if (not cached_weather or CacheKeys.WEATHER in refresh) and weather_limiter.allow():
+                tasks.append(('weather', get_weather(client=http)))
         else:
-            tasks.append(('weather', get_weather()))
+            tasks.append(('weather', get_weather(client=http)))
         
         # Calendar
-        tasks.append(('calendar', get_calendar_events()))
+        tasks.append(('calendar', get_calendar_events(client=http)))
         
         # GitHub (with rate limiting)
-        if REDIS_AVAILABLE and is_redis_available():
-            cached_github = cache_get(CacheKeys.GITHUB)
+        if use_redis:
+            cached_github = cached.get(CacheKeys.GITHUB)
             if cached_github:
                 github_activity = cached_github
-            elif github_limiter.allow():
-                tasks.append(('github', get_github_activity()))
+            if (not cached_github or CacheKeys.GITHUB in refresh) and github_limiter.allow():
+                tasks.append(('github', get_github_activity(client=http)))
         else:
-            tasks.append(('github', get_github_activity()))
+            tasks.append(('github', get_github_activity(client=http)))
         
-        # Execute tasks concurrently
+        # Execute tasks concurrently, bounded so one stuck service can't hold up the briefing
         if tasks:
-            results = await asyncio.gather(
-                *[task[1] for task in tasks],
-                return_exceptions=True
-            )
+            started = time.monotonic()
+            running = {asyncio.create_task(coro): name for name, coro in tasks}
+            try:
+                done, pending = await asyncio.wait(running, timeout=EXTERNAL_FETCH_TIMEOUT)
+            finally:
+                # Also reached if we are cancelled ourselves: never leave fetches orphaned
+                for task in running:
+                    task.cancel()
+            for task in pending:
+                logger.warning(f"Timed out fetching {running[task]} after {EXTERNAL_FETCH_TIMEOUT}s")
+            if pending:
+                await asyncio.wait(pending)
+            # Recompute cost, used to schedule early refreshes
+            elapsed = time.monotonic() - started
             
-            for i, (name, _) in enumerate(tasks):
-                result = results[i]
-                if isinstance(result, Exception):
-                    logger.error(f"Failed to fetch {name}: {result}")
+            for task in done:
+                name = running[task]
+                if task.exception() is not None:
+                    logger.error(f"Failed to fetch {name}: {task.exception()}")
                     continue
                 
+                result = task.result()
                 if name == 'weather' and result:
                     weather_data = result
-                    if REDIS_AVAILABLE and is_redis_available():
-                        cache_set(CacheKeys.WEATHER, result, ttl_seconds=1800)  # 30 min
+                    if use_redis:
+                        cache_set_stamped(CacheKeys.WEATHER, result, ttl_seconds=WEATHER_CACHE_TTL,
+                                          compute_seconds=elapsed)
                 elif name == 'calendar':
                     calendar_events = result or []
                 elif name == 'github' and result:
                     github_activity = result
-                    if REDIS_AVAILABLE and is_redis_available():
-                        cache_set(CacheKeys.GITHUB, result, ttl_seconds=900)  # 15 min
+                    if use_redis:
+                        cache_set_stamped(CacheKeys.GITHUB, result, ttl_seconds=GITHUB_CACHE_TTL,
+                                          compute_seconds=elapsed)
         
     except Exception as e:
         logger.error(f"Error fetching external data: {e}")
@@ -219,135 +270,171 @@ async def get_external_data():
     return weather_data, calendar_events, github_activity
 
 
+# Rendered briefings are cached briefly so retries/duplicate sends skip all DB+HTTP work.
+# Bump the version whenever the message format changes.
+BRIEFING_CACHE_PREFIX = "brief:v1"
+BRIEFING_CACHE_TTL_SECONDS = 600
+
+
 async def generate_briefing_message_async():
     """Generate morning briefing message with external data."""
     try:
-        tz = pytz.timezone(TZ)
-        now = datetime.datetime.now(tz)
-        today_date = now.date()
-        yesterday_date = today_date - datetime.timedelta(days=1)
+        now = datetime.datetime.now(_TZ)
 
-        health = get_health_data(today=today_date)
-        activities = get_recent_activities(3)
+        cache_key = f"{BRIEFING_CACHE_PREFIX}:{now.date()}:{'am' if now.hour < 12 else 'pm'}"
+        use_cache = REDIS_AVAILABLE and is_redis_available()
+        if use_cache:
+            cached = cache_get(cache_key)
+            if cached:
+                return cached
 
-        # Fetch external data
-        weather_data, calendar_events, github_activity = await get_external_data()
+        message = await _build_briefing_message(now)
 
-        today = str(today_date)
-        yesterday = str(yesterday_date)
+        if use_cache:
+            cache_set(cache_key, message, ttl_seconds=BRIEFING_CACHE_TTL_SECONDS)
+        return message
 
-        # Use today's row for sleep if available; if not, fall back to yesterday BUT label it clearly.
-        sleep_data = health.get(today) or health.get(yesterday) or {}
-        sleep_date = today if health.get(today) else (yesterday if health.get(yesterday) else None)
+    except Exception as e:
+        logger.error(f"Failed to generate briefing: {e}")
+        return f"⚠️ 브리핑 생성 실패: {e}"
 
-        today_data = health.get(today, {})
 
-        # Build message
-        is_morning = now.hour < 12
+async def _build_briefing_message(now: datetime.datetime) -> str:
+    today_date = now.date()
+    yesterday_date = today_date - datetime.timedelta(days=1)
 
-        if is_morning:
-            lines = ["🌅 *Good Morning!*\n"]
-        else:
-            lines = ["🌙 *Evening Summary*\n"]
+    # DB query overlaps the external HTTP fetches; a DB failure cancels the fetches
+    (health, activities), (weather_data, calendar_events, github_activity) = await gather_cancel_on_error(
+        get_briefing_data(today_date, 3),
+        get_external_data()
+    )
 
-        # Weather section (NEW)
-        if EXTERNAL_SERVICES_AVAILABLE and weather_data:
-            lines.append(format_weather(weather_data))
-            lines.append("")
-        
-        # Calendar section (NEW)
-        if EXTERNAL_SERVICES_AVAILABLE and calendar_events:
-            lines.append(format_calendar_events(calendar_events))
-            lines.append("")
-
-        # Sleep summary
-        if sleep_data and sleep_date:
-            sleep_hours = sleep_data.get('sleep_hours', 0)
-            sleep_score = sleep_data.get('sleep_score', 0)
-            label = "오늘 수면" if sleep_date == today else "어제 수면"
-            # Always show the date to avoid confusion.
-            lines.append(f"😴 *{label}* ({sleep_date}): {sleep_hours}시간 (점수: {sleep_score})")
-            if (not is_morning) and sleep_date != today:
-                lines.append("   (참고: 오늘 수면 데이터가 아직 동기화되지 않아 어제 값을 표시했어요)")
-        else:
-            lines.append("😴 *수면 데이터*: 없음")
-
-        # Body Battery
-        if today_data:
-            bb_max = today_data.get('body_battery_max', 0)
-            stress = today_data.get('stress_level', 0)
-            rhr = today_data.get('resting_hr', 0)
-            hrv = today_data.get('hrv_status', 'N/A')
-
-            # Body battery status
-            if bb_max >= 80:
-                bb_emoji = "🔋"
-                bb_status = "충전 완료!"
-            elif bb_max >= 50:
-                bb_emoji = "🔋"
-                bb_status = "적당함"
-            else:
-                bb_emoji = "🪫"
-                bb_status = "휴식 필요"
+    today = str(today_date)
+    yesterday = str(yesterday_date)
 
-            lines.append(f"{bb_emoji} *Body Battery*: {bb_max}% → {bb_status}")
-            lines.append(f"💓 *안정시 심박수*: {rhr} bpm (HRV: {hrv})")
-            lines.append(f"😰 *평균 스트레스*: {stress}")
-        else:
-            lines.append("📊 *오늘 데이터*: 아직 동기화 안됨")
-
-        # Recent activities
-        if activities:
-            lines.append("\n🏃 *최근 운동*:")
-            for act in activities[:3]:
-                act_date = act['start_time'].strftime("%m/%d") if act['start_time'] else ""
-                distance_km = (act['distance_meters'] or 0) / 1000
-                duration = format_duration(act['duration_sec'])
-                pace = act['avg_pace'] or ""
-
-                if act['type'] == 'running':
-                    emoji = "🏃"
-                    detail = f"{distance_km:.1f}km"
-                    if pace:
-                        detail += f" ({pace}/km)"
-                elif act['type'] == 'cycling':
-                    emoji = "🚴"
-                    detail = f"{distance_km:.1f}km"
-                elif act['type'] == 'swimming':
-                    emoji = "🏊"
-                    detail = f"{distance_km*1000:.0f}m"
-                else:
-                    emoji = "💪"
-                    detail = duration
-
-                lines.append(f"  {emoji} {act_date} {act.get('name', act['type'])}: {detail}")
-
-        # GitHub activity (NEW)
-        if EXTERNAL_SERVICES_AVAILABLE and github_activity:
-            github_str = format_github_activity(github_activity)
-            if github_str:
-                lines.append("")
-                lines.append(github_str)
-
-        # Add motivational note based on data
-        lines.append("\n---")
-        if today_data and today_data.get('body_battery_max', 0) >= 80:
-            lines.append("✨ 오늘 컨디션 좋아 보여요! 좋은 하루 되세요!")
-        elif sleep_data and sleep_data.get('sleep_hours', 0) < 6:
-            lines.append("😴 수면이 부족해요. 오늘은 무리하지 마세요.")
+    # Use today's row for sleep if available; if not, fall back to yesterday BUT label it clearly.
+    sleep_data = health.get(today) or health.get(yesterday) or {}
+    sleep_date = today if health.get(today) else (yesterday if health.get(yesterday) else None)
+
+    today_data = health.get(today, {})
+
+    # Build message: each section is a complete block of lines, empty when not shown
+    is_morning = now.hour < 12
+    header = "🌅 *Good Morning!*" if is_morning else "🌙 *Evening Summary*"
+
+    weather = ""
+    calendar = ""
+    github = ""
+    if EXTERNAL_SERVICES_AVAILABLE:
+        if weather_data:
+            weather = f"{format_weather(weather_data)}\n\n"
+        if calendar_events:
+            calendar = f"{format_calendar_events(calendar_events)}\n\n"
+        github_str = format_github_activity(github_activity) if github_activity else ""
+        if github_str:
+            github = f"\n{github_str}\n"
+
+    # Sleep summary (always show the date to avoid confusion)
+    if sleep_data and sleep_date:
+        label = "오늘 수면" if sleep_date == today else "어제 수면"
+        sleep = (
+            f"😴 *{label}* ({sleep_date}): {sleep_data.get('sleep_hours', 0)}시간 "
+            f"(점수: {sleep_data.get('sleep_score', 0)})\n"
+        )
+        if (not is_morning) and sleep_date != today:
+            sleep += "   (참고: 오늘 수면 데이터가 아직 동기화되지 않아 어제 값을 표시했어요)\n"
+    else:
+        sleep = "😴 *수면 데이터*: 없음\n"
+
+    # Body Battery
+    if today_data:
+        bb_max = today_data.get('body_battery_max', 0)
+        if bb_max >= 80:
+            bb_emoji, bb_status = "🔋", "충전 완료!"
+        elif bb_max >= 50:
+            bb_emoji, bb_status = "🔋", "적당함"
         else:
-            lines.append("💪 좋은 하루 되세요!")
+            bb_emoji, bb_status = "🪫", "휴식 필요"
 
-        return "\n".join(lines)
+        condition = (
+            f"{bb_emoji} *Body Battery*: {bb_max}% → {bb_status}\n"
+            f"💓 *안정시 심박수*: {today_data.get('resting_hr', 0)} bpm "
+            f"(HRV: {today_data.get('hrv_status', 'N/A')})\n"
+            f"😰 *평균 스트레스*: {today_data.get('stress_level', 0)}\n"
+        )
+    else:
+        condition = "📊 *오늘 데이터*: 아직 동기화 안됨\n"
+
+    # Recent activities
+    recent = ""
+    if activities:
+        recent = "\n🏃 *최근 운동*:\n" + "".join(map(_format_activity_line, activities[:3]))
+
+    # Motivational note based on data
+    if today_data and today_data.get('body_battery_max', 0) >= 80:
+        note = "✨ 오늘 컨디션 좋아 보여요! 좋은 하루 되세요!"
+    elif sleep_data and sleep_data.get('sleep_hours', 0) < 6:
+        note = "😴 수면이 부족해요. 오늘은 무리하지 마세요."
+    else:
+        note = "💪 좋은 하루 되세요!"
+
+    return f"{header}\n\n{weather}{calendar}{sleep}{condition}{recent}{github}\n---\n{note}"
+
+
+def _format_activity_line(act: dict) -> str:
+    if act['type'] == 'running':
+        emoji = "🏃"
+        detail = f"{act['distance_km']}km"
+        if act['avg_pace']:
+            detail += f" ({act['avg_pace']}/km)"
+    elif act['type'] == 'cycling':
+        emoji = "🚴"
+        detail = f"{act['distance_km']}km"
+    elif act['type'] == 'swimming':
+        emoji = "🏊"
+        detail = f"{act['distance_m']}m"
+    else:
+        emoji = "💪"
+        detail = act['duration']
+    return f"  {emoji} {act['date']} {act['name']}: {detail}\n"
 
-    except Exception as e:
-        logger.error(f"Failed to generate briefing: {e}")
-        return f"⚠️ 브리핑 생성 실패: {e}"
+
+# One Bot (and its HTTP connection pool) for the life of the event loop
+_bot: Bot | None = None
+
+
+async def get_bot() -> Bot:
+    global _bot
+    if _bot is None:
+        _bot = Bot(token=TELEGRAM_BOT_TOKEN)
+        await _bot.initialize()
+    return _bot
+
+
+async def _shutdown_clients():
+    """Close the shared Bot, DB pool and HTTP client; call before the event loop ends."""
+    global _bot, _db_pool
+    if _bot is not None:
+        bot, _bot = _bot, None
+        await bot.shutdown()
+    if _db_pool is not None:
+        pool, _db_pool = _db_pool, None
+        await pool.close()
+    if EXTERNAL_SERVICES_AVAILABLE:
+        await close_http_client()
+
+
+async def _with_cleanup(coro):
+    """Run a coroutine, then close shared clients before asyncio.run() ends its loop."""
+    try:
+        return await coro
+    finally:
+        await _shutdown_clients()
 
 
 def generate_briefing_message():
     """Sync wrapper for backward compatibility."""
-    return asyncio.run(generate_briefing_message_async())
+    return asyncio.run(_with_cleanup(generate_briefing_message_async()))
 
 
 async def send_briefing():
@@ -357,7 +444,7 @@ async def send_briefing():
         return
 
     try:
-        bot = Bot(token=TELEGRAM_BOT_TOKEN)
+        bot = await get_bot()
         message = await generate_briefing_message_async()
 
         await bot.send_message(
@@ -373,7 +460,59 @@ async def send_briefing():
 
 def run_briefing():
     """Wrapper to run async send_briefing."""
-    asyncio.run(send_briefing())
+    asyncio.run(_with_cleanup(send_briefing()))
+
+
+# Local (TZ) times of the daily briefings.
+# Note: Garmin sync may complete slightly after 22:00 depending on runtime; sleep section
+# will fall back to yesterday with an explicit note if today's row isn't available yet.
+BRIEFING_TIMES = ((10, 0), (22, 0))
+
+
+def _next_run(after: datetime.datetime, tz) -> datetime.datetime:
+    """Earliest briefing slot strictly after `after`."""
+    candidates = []
+    for hour, minute in BRIEFING_TIMES:
+        for day in (after.date(), after.date() + datetime.timedelta(days=1)):
+            run = tz.localize(datetime.datetime.combine(day, datetime.time(hour, minute)))
+            if run > after:
+                candidates.append(run)
+                break
+    return min(candidates)
+
+
+async def scheduler():
+    """Sleep until each briefing slot and send it; one event loop, no polling."""
+    last_run = datetime.datetime.now(_TZ)
+    while True:
+        next_run = _next_run(last_run, _TZ)
+        delay = (next_run - datetime.datetime.now(_TZ)).total_seconds()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        await send_briefing()
+        last_run = next_run
+
+
+async def _run():
+    # Wait for other services
+    await asyncio.sleep(15)
+
+    # Single entry point: make it obvious in the logs which file the container is running
+    logger.info(f"worker-brief started from {os.path.abspath(__file__)}")
+    logger.info("Scheduled briefings: " + ", ".join(f"{h:02d}:{m:02d}" for h, m in BRIEFING_TIMES))
+
+    # For testing: send briefing on startup if it's between 6-8 AM or 21-23
+    now = datetime.datetime.now(_TZ)
+    hour = now.hour
+
+    if 6 <= hour <= 8 or 21 <= hour <= 23:
+        logger.info("Sending startup briefing...")
+        await send_briefing()
+
+    try:
+        await scheduler()
+    finally:
+        await _shutdown_clients()
 
 
 def main():
@@ -396,31 +535,7 @@ def main():
     else:
         logger.warning("Redis: Not available")
 
-    # Wait for other services
-    time.sleep(15)
-
-    # Schedule morning briefing at 10:00 AM
-    schedule.every().day.at("10:00").do(run_briefing)
-
-    # Also schedule an evening summary at 22:00
-    # Note: Garmin sync may complete slightly after 22:00 depending on runtime; sleep section
-    # will fall back to yesterday with an explicit note if today's row isn't available yet.
-    schedule.every().day.at("22:00").do(run_briefing)
-
-    logger.info("Scheduled briefings: 10:00, 22:00")
-
-    # For testing: send briefing on startup if it's between 6-8 AM or 21-23
-    tz = pytz.timezone(TZ)
-    now = datetime.datetime.now(tz)
-    hour = now.hour
-
-    if 6 <= hour <= 8 or 21 <= hour <= 23:
-        logger.info("Sending startup briefing...")
-        run_briefing()
-
-    while True:
-        schedule.run_pending()
-        time.sleep(60)
+    asyncio.run(_run())
 
 
 if __name__ == "__main__":
@@ -14,7 +14,8 @@ import sys
 import json
 import argparse
 import datetime
-import psycopg2
+from contextlib import contextmanager
+from psycopg2 import pool as pg_pool
 
 # Database configuration
 POSTGRES_HOST = os.getenv("POSTGRES_HOST", "postgres")
@@ -23,13 +24,41 @@ POSTGRES_USER = os.getenv("POSTGRES_USER", "clawd_user")
 POSTGRES_PASSWORD = os.getenv("POSTGRES_PASSWORD", "password")
 
 
-def get_db_connection():
-    return psycopg2.connect(
-        host=POSTGRES_HOST,
-        database=POSTGRES_DB,
-        user=POSTGRES_USER,
-        password=POSTGRES_PASSWORD
-    )
+# One connection reused by every query in this (single-threaded) CLI run
+_db_pool = None
+
+
+def get_db_pool():
+    global _db_pool
+    if _db_pool is None:
+        _db_pool = pg_pool.SimpleConnectionPool(
+            1,
+            2,
+            host=POSTGRES_HOST,
+            database=POSTGRES_DB,
+            user=POSTGRES_USER,
+            password=POSTGRES_PASSWORD,
+            keepalives=1,
+            keepalives_idle=30
+        )
+    return _db_pool
+
+
+@contextmanager
+def db_cursor():
+    """Cursor on a pooled connection; commits on success, rolls back on error."""
+    pool = get_db_pool()
+    conn = pool.getconn()
+    try:
+        with conn.cursor() as cur:
+            yield cur
+        conn.commit()
+    except Exception:
+        if not conn.closed:
+            conn.rollback()
+        raise
+    finally:
+        pool.putconn(conn, close=bool(conn.closed))
 
 
 def query_health(date_str=None, days=1):
@@ -42,9 +71,49 @@ def query_health(date_str=None, days=1):
     Returns:
         List of health records as dicts
     """
-    conn = get_db_connection()
-    cur = conn.cursor()
+    return list(iter_health(date_str, days))
 
+
+def iter_health(date_str=None, days=1):
+    """Yield health records (as query_health) one at a time."""
+    if date_str:
+        target_date = datetime.datetime.strptime(date_str, "%Y-%m-%d").date()
+    else:
+        target_date = datetime.date.today()
+
+    start_date = target_date - datetime.timedelta(days=days-1)
+
+    with db_cursor() as cur:
+        cur.execute("""
+            SELECT date, sleep_hours, sleep_score, resting_hr, hrv_status,
+                   stress_level, body_battery_max, body_battery_min
+            FROM health_daily
+            WHERE date BETWEEN %s AND %s
+            ORDER BY date DESC
+        """, (start_date, target_date))
+        for row in cur:
+            yield {
+                "date": str(row[0]),
+                "sleep_hours": row[1],
+                "sleep_score": row[2],
+                "resting_hr": row[3],
+                "hrv_status": row[4],
+                "stress_level": row[5],
+                "body_battery_max": row[6],
+                "body_battery_min": row[7]
+            }
+
+
+def query_health_summary(date_str=None, days=7):
+    """Aggregate health data over a date range in SQL.
+
+    Args:
+        date_str: Last date of the range (YYYY-MM-DD), defaults to today
+        days: Number of days in the range
+
+    Returns:
+        Dict of averages and the first/last dates that have data
+    """
     if date_str:
         target_date = datetime.datetime.strptime(date_str, "%Y-%m-%d").date()
     else:
@@ -52,32 +121,25 @@ def query_health(date_str=None, days=1):
 
     start_date = target_date - datetime.timedelta(days=days-1)
 
-    cur.execute("""
-        SELECT date, sleep_hours, sleep_score, resting_hr, hrv_status,
-               stress_level, body_battery_max, body_battery_min
-        FROM health_daily
-        WHERE date BETWEEN %s AND %s
-        ORDER BY date DESC
-    """, (start_date, target_date))
-
-    rows = cur.fetchall()
-    cur.close()
-    conn.close()
-
-    results = []
-    for row in rows:
-        results.append({
-            "date": str(row[0]),
-            "sleep_hours": row[1],
-            "sleep_score": row[2],
-            "resting_hr": row[3],
-            "hrv_status": row[4],
-            "stress_level": row[5],
-            "body_battery_max": row[6],
-            "body_battery_min": row[7]
-        })
-
-    return results
+    with db_cursor() as cur:
+        cur.execute("""
+            SELECT min(date), max(date), count(*),
+                   round(avg(sleep_hours)::numeric, 1),
+                   round(avg(resting_hr)::numeric, 1),
+                   round(avg(stress_level)::numeric, 1)
+            FROM health_daily
+            WHERE date BETWEEN %s AND %s
+        """, (start_date, target_date))
+        row = cur.fetchone()
+
+    return {
+        "start_date": str(row[0]) if row[0] else None,
+        "end_date": str(row[1]) if row[1] else None,
+        "days": row[2],
+        "avg_sleep_hours": row[3],
+        "avg_resting_hr": row[4],
+        "avg_stress_level": row[5]
+    }
 
 
 def query_exercise(days=7, limit=10):
@@ -90,41 +152,36 @@ def query_exercise(days=7, limit=10):
     Returns:
         List of exercise records as dicts
     """
-    conn = get_db_connection()
-    cur = conn.cursor()
+    return list(iter_exercise(days, limit))
+
 
+def iter_exercise(days=7, limit=10):
+    """Yield exercise records (as query_exercise) one at a time."""
     start_date = datetime.date.today() - datetime.timedelta(days=days)
 
-    cur.execute("""
-        SELECT activity_type, activity_name, start_time, duration_sec,
-               distance_meters, avg_hr, max_hr, avg_pace, calories
-        FROM exercise_activity
-        WHERE start_time >= %s
-        ORDER BY start_time DESC
-        LIMIT %s
-    """, (start_date, limit))
-
-    rows = cur.fetchall()
-    cur.close()
-    conn.close()
-
-    results = []
-    for row in rows:
-        results.append({
-            "type": row[0],
-            "name": row[1],
-            "start_time": str(row[2]) if row[2] else None,
-            "duration_sec": row[3],
-            "duration_min": round(row[3] / 60, 1) if row[3] else None,
-            "distance_meters": row[4],
-            "distance_km": round(row[4] / 1000, 2) if row[4] else None,
-            "avg_hr": row[5],
-            "max_hr": row[6],
-            "avg_pace": row[7],
-            "calories": row[8]
-        })
-
-    return results
+    with db_cursor() as cur:
+        cur.execute("""
+            SELECT activity_type, activity_name, start_time, duration_sec,
+                   distance_meters, avg_hr, max_hr, avg_pace, calories
+            FROM exercise_activity
+            WHERE start_time >= %s
+            ORDER BY start_time DESC
+            LIMIT %s
+        """, (start_date, limit))
+        for row in cur:
+            yield {
+                "type": row[0],
+                "name": row[1],
+                "start_time": str(row[2]) if row[2] else None,
+                "duration_sec": row[3],
+                "duration_min": round(row[3] / 60, 1) if row[3] else None,
+                "distance_meters": row[4],
+                "distance_km": round(row[4] / 1000, 2) if row[4] else None,
+                "avg_hr": row[5],
+                "max_hr": row[6],
+                "avg_pace": row[7],
+                "calories": row[8]
+            }
 
 
 def generate_briefing():
@@ -161,6 +218,17 @@ def generate_briefing():
     return "\n".join(lines)
 
 
+def write_json_array(records, out=None):
+    """Write records as a JSON array, one object per line, without building it in memory."""
+    out = out or sys.stdout
+    first = True
+    for record in records:
+        out.write("[\n  " if first else ",\n  ")
+        out.write(json.dumps(record, ensure_ascii=False, default=str))
+        first = False
+    out.write("[]\n" if first else "\n]\n")
+
+
 def main():
     parser = argparse.ArgumentParser(description="Query health and exercise data")
     subparsers = parser.add_subparsers(dest="command", help="Command to run")
@@ -183,17 +251,28 @@ def main():
     args = parser.parse_args()
 
     if args.command == "health":
-        data = query_health(date_str=args.date, days=args.days)
+        if args.format == "text" and args.days > 1:
+            # Multi-day text output is a summary; only the aggregates leave the database
+            s = query_health_summary(date_str=args.date, days=args.days)
+            if s["days"]:
+                print(f"{s['start_date']} ~ {s['end_date']} ({s['days']} days): "
+                      f"Sleep avg {s['avg_sleep_hours']}h, HR avg {s['avg_resting_hr']}, "
+                      f"Stress avg {s['avg_stress_level']}")
+            else:
+                print("No health data available.")
+            return
+
+        data = iter_health(date_str=args.date, days=args.days)
         if args.format == "json":
-            print(json.dumps(data, indent=2, ensure_ascii=False))
+            write_json_array(data)
         else:
             for d in data:
                 print(f"{d['date']}: Sleep {d['sleep_hours']}h, HR {d['resting_hr']}, Stress {d['stress_level']}")
 
     elif args.command == "exercise":
-        data = query_exercise(days=args.days, limit=args.limit)
+        data = iter_exercise(days=args.days, limit=args.limit)
         if args.format == "json":
-            print(json.dumps(data, indent=2, ensure_ascii=False))
+            write_json_array(data)
         else:
             for ex in data:
                 print(f"{ex['start_time']}: {ex['name']} - {ex['duration_min']}min")
@@ -15,18 +15,25 @@ Notes:
 """
 
 import os
-import time
+import json
+import signal
+import asyncio
 import logging
 import datetime as dt
 import re
 from typing import Any, Dict, List, Optional, Tuple
 
-import schedule
 import pytz
-import psycopg2
-from psycopg2.extras import RealDictCursor, Json
-import decimal
-import threading
+import httpx
+from psycopg.conninfo import make_conninfo
+from psycopg.rows import dict_row
+from psycopg.types.json import Jsonb
+from psycopg.types.numeric import FloatLoader
+from psycopg_pool import AsyncConnectionPool
+import functools
+import collections
+import importlib.util
+from contextlib import asynccontextmanager
 
 
 class _RedactTelegramBotToken(logging.Filter):
@@ -81,18 +88,87 @@ POSTGRES_PASSWORD = os.getenv("POSTGRES_PASSWORD", "password")
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+OPENAI_EMBEDDING_MODEL = os.getenv("OPENAI_EMBEDDING_MODEL", "text-embedding-3-small")
 
+# Semantic cache for workout reviews (opt-in): reuse a previous review when the new run's
+# input embeds within REVIEW_CACHE_MIN_SIMILARITY (cosine) of one already reviewed.
+REVIEW_CACHE_ENABLED = os.getenv("COACH_REVIEW_CACHE") == "1"
+REVIEW_CACHE_MIN_SIMILARITY = float(os.getenv("COACH_REVIEW_CACHE_MIN_SIMILARITY", "0.95"))
 
-def get_db_connection():
-    return psycopg2.connect(
-        host=POSTGRES_HOST,
-        database=POSTGRES_DB,
-        user=POSTGRES_USER,
-        password=POSTGRES_PASSWORD,
-    )
+
+# Persistent HTTP client for OpenAI and Telegram sends: keep-alive (and HTTP/2 when `h2`
+# is installed) so repeat calls and retries skip the TCP+TLS handshake.
+_HTTP2 = importlib.util.find_spec("h2") is not None
+_http: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    global _http
+    if _http is None:
+        _http = httpx.AsyncClient(
+            http2=_HTTP2,
+            timeout=60.0,
+            limits=httpx.Limits(max_keepalive_connections=4),
+        )
+    return _http
+
+
+async def close_http_client():
+    global _http
+    if _http is not None:
+        client, _http = _http, None
+        await client.aclose()
+
+
+# Async pool shared by scheduled jobs and Telegram handlers (all on one event loop).
+_db_pool: Optional[AsyncConnectionPool] = None
+# Serializes the first get_db_pool() so concurrent callers (asyncio.gather) share one pool
+_db_pool_lock = asyncio.Lock()
+
+
+async def _configure_conn(conn):
+    # NUMERIC columns arrive as float (not Decimal), so query results serialize as-is
+    conn.adapters.register_loader("numeric", FloatLoader)
+
+
+async def get_db_pool() -> AsyncConnectionPool:
+    global _db_pool
+    if _db_pool is None:
+        async with _db_pool_lock:
+            if _db_pool is None:
+                pool = AsyncConnectionPool(
+                    conninfo=make_conninfo(
+                        host=POSTGRES_HOST,
+                        dbname=POSTGRES_DB,
+                        user=POSTGRES_USER,
+                        password=POSTGRES_PASSWORD,
+                    ),
+                    min_size=2,
+                    max_size=8,
+                    configure=_configure_conn,
+                    open=False,
+                )
+                await pool.open()
+                _db_pool = pool
+    return _db_pool
+
+
+async def close_db_pool():
+    global _db_pool
+    if _db_pool is not None:
+        pool, _db_pool = _db_pool, None
+        await pool.close()
+
+
+@asynccontextmanager
+async def get_conn():
+    """Pooled connection; commits on success, rolls back on error."""
+    pool = await get_db_pool()
+    async with pool.connection() as conn:
+        yield conn
 
 
-def init_db():
+async def init_db():
     """Create coach tables if missing."""
     ddl = [
         """
@@ -145,6 +221,15 @@ def init_db():
         );
         """,
         """
+        CREATE TABLE IF NOT EXISTS review_cache (
+          id BIGSERIAL PRIMARY KEY,
+          embedding REAL[] NOT NULL,
+          response TEXT NOT NULL,
+          model TEXT,
+          created_at TIMESTAMP DEFAULT NOW()
+        );
+        """,
+        """
         CREATE TABLE IF NOT EXISTS workout_review_log (
           activity_id BIGINT PRIMARY KEY,
           sent_at TIMESTAMP,
@@ -154,15 +239,23 @@ def init_db():
           error TEXT
         );
         """,
+        # Redundant with the workout_review_log primary key; drop it where it was created
+        "DROP INDEX IF EXISTS idx_workout_review_sent;",
+        # exercise_activity belongs to worker-garmin; index it only once it exists
+        """
+        DO $$
+        BEGIN
+          IF to_regclass('exercise_activity') IS NOT NULL THEN
+            CREATE INDEX IF NOT EXISTS idx_exercise_activity_running_start
+              ON exercise_activity (start_time DESC NULLS LAST) WHERE activity_type='running';
+          END IF;
+        END $$;
+        """,
     ]
 
-    conn = get_db_connection()
-    cur = conn.cursor()
-    for stmt in ddl:
-        cur.execute(stmt)
-    conn.commit()
-    cur.close()
-    conn.close()
+    async with get_conn() as conn, conn.cursor() as cur:
+        for stmt in ddl:
+            await cur.execute(stmt)
     logger.info("Coach DB tables ensured.")
 
 
@@ -179,33 +272,20 @@ def next_week_start(today: dt.date) -> dt.date:
     return today + dt.timedelta(days=days_until_next_monday)
 
 
-def select_one(query: str, params: Tuple = ()) -> Optional[Dict[str, Any]]:
-    conn = get_db_connection()
-    cur = conn.cursor(cursor_factory=RealDictCursor)
-    cur.execute(query, params)
-    row = cur.fetchone()
-    cur.close()
-    conn.close()
-    return dict(row) if row else None
-
+async def select_one(query: str, params: Tuple = ()) -> Optional[Dict[str, Any]]:
+    async with get_conn() as conn, conn.cursor(row_factory=dict_row) as cur:
+        await cur.execute(query, params)
+        return await cur.fetchone()
 
-def select_all(query: str, params: Tuple = ()) -> List[Dict[str, Any]]:
-    conn = get_db_connection()
-    cur = conn.cursor(cursor_factory=RealDictCursor)
-    cur.execute(query, params)
-    rows = cur.fetchall()
-    cur.close()
-    conn.close()
-    return [dict(r) for r in rows]
 
+async def select_all(query: str, params: Tuple = ()) -> List[Dict[str, Any]]:
+    async with get_conn() as conn, conn.cursor(row_factory=dict_row) as cur:
+        await cur.execute(query, params)
+        return await cur.fetchall()
 
-def has_confirmed_plan(week_start: dt.date) -> bool:
-    row = select_one("SELECT id FROM training_plan_weekly WHERE week_start=%s", (week_start,))
-    return row is not None
 
-
-def get_latest_draft(week_start: dt.date) -> Optional[Dict[str, Any]]:
-    return select_one(
+async def get_latest_draft(week_start: dt.date) -> Optional[Dict[str, Any]]:
+    return await select_one(
         """
         SELECT id, week_start, version, status, draft_text, draft_data, created_at
         FROM training_plan_draft_weekly
@@ -217,12 +297,20 @@ def get_latest_draft(week_start: dt.date) -> Optional[Dict[str, Any]]:
     )
 
 
-def has_draft(week_start: dt.date) -> bool:
-    return get_latest_draft(week_start) is not None
+async def get_plan_state(week_start: dt.date) -> Dict[str, bool]:
+    """{confirmed, draft}: whether the week has a confirmed plan / an active draft (one round trip)."""
+    return await select_one(
+        """
+        SELECT
+          EXISTS(SELECT 1 FROM training_plan_weekly WHERE week_start=%s) AS confirmed,
+          EXISTS(SELECT 1 FROM training_plan_draft_weekly WHERE week_start=%s AND status='draft') AS draft
+        """,
+        (week_start, week_start),
+    )
 
 
-def get_next_race() -> Optional[Dict[str, Any]]:
-    return select_one(
+async def get_next_race() -> Optional[Dict[str, Any]]:
+    return await select_one(
         """
         SELECT id, name, race_date, distance_km, target_time_sec, location
         FROM race_event
@@ -233,8 +321,8 @@ def get_next_race() -> Optional[Dict[str, Any]]:
     )
 
 
-def get_recent_injuries(limit: int = 5) -> List[Dict[str, Any]]:
-    return select_all(
+async def get_recent_injuries(limit: int = 5) -> List[Dict[str, Any]]:
+    return await select_all(
         """
         SELECT date, body_part, side, pain_score, pain_type, trigger, notes
         FROM injury_log
@@ -245,8 +333,8 @@ def get_recent_injuries(limit: int = 5) -> List[Dict[str, Any]]:
     )
 
 
-def get_last_runs(limit: int = 2) -> List[Dict[str, Any]]:
-    runs = select_all(
+async def get_last_runs(limit: int = 2) -> List[Dict[str, Any]]:
+    runs = await select_all(
         """
         SELECT activity_id, activity_type, activity_name, start_time, duration_sec,
                distance_meters, avg_hr, max_hr, avg_pace
@@ -258,23 +346,27 @@ def get_last_runs(limit: int = 2) -> List[Dict[str, Any]]:
         (limit,),
     )
 
-    # add laps
-    for r in runs:
-        laps = select_all(
+    # add laps (one query for all runs)
+    laps_by_aid: Dict[Any, List[Dict[str, Any]]] = collections.defaultdict(list)
+    if runs:
+        laps = await select_all(
             """
-            SELECT lap_index, distance_meters, duration_sec, avg_pace, avg_hr, max_hr
+            SELECT activity_id, lap_index, distance_meters, duration_sec, avg_pace, avg_hr, max_hr
             FROM exercise_lap
-            WHERE activity_id=%s
-            ORDER BY lap_index
+            WHERE activity_id = ANY(%s)
+            ORDER BY activity_id, lap_index
             """,
-            (r["activity_id"],),
+            ([r["activity_id"] for r in runs],),
         )
-        r["laps"] = laps
+        for lap in laps:
+            laps_by_aid[lap.pop("activity_id")].append(lap)
+    for r in runs:
+        r["laps"] = laps_by_aid[r["activity_id"]]
     return runs
 
 
-def get_running_summary_14d() -> Dict[str, Any]:
-    rows = select_all(
+async def get_running_summary_14d() -> Dict[str, Any]:
+    rows = await select_all(
         """
         SELECT
           COUNT(*)::int AS run_count,
@@ -290,6 +382,16 @@ def get_running_summary_14d() -> Dict[str, Any]:
     return rows[0] if rows else {}
 
 
+async def get_draft_inputs() -> Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]], Dict[str, Any], List[Dict[str, Any]]]:
+    """(race, injuries, summary14, last_runs) for a weekly draft, queried concurrently."""
+    return await asyncio.gather(
+        get_next_race(),
+        get_recent_injuries(5),
+        get_running_summary_14d(),
+        get_last_runs(2),
+    )
+
+
 def fmt_hms(seconds: Optional[int]) -> str:
     if not seconds:
         return "0:00:00"
@@ -300,45 +402,50 @@ def fmt_hms(seconds: Optional[int]) -> str:
     return f"{h}:{m:02d}:{sec:02d}"
 
 
-def _json_sanitize(obj: Any) -> Any:
-    """Make objects JSON-serializable (dates/timestamps/decimals)."""
-    if obj is None:
-        return None
-    if isinstance(obj, (dt.date, dt.datetime)):
-        return obj.isoformat()
-    if isinstance(obj, decimal.Decimal):
-        return float(obj)
-    if isinstance(obj, dict):
-        return {k: _json_sanitize(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [_json_sanitize(v) for v in obj]
-    return obj
+class _JSONEncoder(json.JSONEncoder):
+    """Dates/timestamps as ISO strings (NUMERIC is already float, see _configure_conn)."""
+
+    def default(self, obj: Any) -> Any:
+        if isinstance(obj, (dt.date, dt.datetime)):
+            return obj.isoformat()
+        return super().default(obj)
+
+
+def _json_dumps(obj: Any, **kwargs: Any) -> str:
+    return json.dumps(obj, cls=_JSONEncoder, ensure_ascii=False, **kwargs)
 
 
 def _read_prompt(path: str) -> str:
+    """Prompt file contents, re-read only when the file changes."""
+    return _read_prompt_cached(path, os.stat(path).st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=16)
+def _read_prompt_cached(path: str, mtime_ns: int) -> str:
     with open(path, "r", encoding="utf-8") as f:
         return f.read().strip()
 
 
-def _render_prompt(template: str, data: Dict[str, Any]) -> str:
-    import json
+def _data_message(data: Dict[str, Any]) -> str:
+    return _json_dumps(data, indent=2)
 
-    return template.replace("{{DATA_JSON}}", json.dumps(data, ensure_ascii=False, indent=2))
 
+async def _openai_generate_async(system: List[str], user: str) -> str:
+    """Call OpenAI Chat Completions API with basic retry/backoff.
 
-def _openai_generate(system: str, user: str) -> str:
-    """Call OpenAI Chat Completions API with basic retry/backoff."""
+    Provider prompt caches match on the longest identical prefix, so keep the order
+    "static first, dynamic last": persona/template text goes in `system` (byte-identical
+    across calls) and only the per-call DATA JSON goes in `user`.
+    """
     if not OPENAI_API_KEY:
         raise RuntimeError("OPENAI_API_KEY not configured")
 
-    import httpx
-
     url = "https://api.openai.com/v1/chat/completions"
     headers = {"Authorization": f"Bearer {OPENAI_API_KEY}", "Content-Type": "application/json"}
     payload = {
         "model": OPENAI_MODEL,
         "messages": [
-            {"role": "system", "content": system},
+            *({"role": "system", "content": part} for part in system),
             {"role": "user", "content": user},
         ],
         "temperature": 0.4,
@@ -347,14 +454,13 @@ def _openai_generate(system: str, user: str) -> str:
     last_err: Optional[Exception] = None
     for attempt in range(3):
         try:
-            with httpx.Client(timeout=60.0) as client:
-                resp = client.post(url, headers=headers, json=payload)
+            resp = await get_http_client().post(url, headers=headers, json=payload)
 
             # retry on rate limits
             if resp.status_code == 429:
                 wait_s = 2 * (2**attempt)
                 logger.warning(f"OpenAI rate limited (429). Retrying in {wait_s}s...")
-                time.sleep(wait_s)
+                await asyncio.sleep(wait_s)
                 continue
 
             resp.raise_for_status()
@@ -364,26 +470,40 @@ def _openai_generate(system: str, user: str) -> str:
             last_err = e
             wait_s = 2 * (2**attempt)
             logger.warning(f"OpenAI call failed (attempt {attempt+1}/3): {e}. Retrying in {wait_s}s")
-            time.sleep(wait_s)
+            await asyncio.sleep(wait_s)
 
     raise RuntimeError(f"OpenAI call failed after retries: {last_err}")
 
 
-def draft_template(week_start: dt.date, race: Optional[Dict[str, Any]], injuries: List[Dict[str, Any]], summary14: Dict[str, Any], last_runs: List[Dict[str, Any]]) -> Tuple[str, Dict[str, Any]]:
+async def _openai_embed_async(text: str) -> List[float]:
+    """Embed text with the OpenAI Embeddings API (single attempt; callers treat failure as a miss)."""
+    if not OPENAI_API_KEY:
+        raise RuntimeError("OPENAI_API_KEY not configured")
+
+    resp = await get_http_client().post(
+        "https://api.openai.com/v1/embeddings",
+        headers={"Authorization": f"Bearer {OPENAI_API_KEY}"},
+        json={"model": OPENAI_EMBEDDING_MODEL, "input": text},
+        timeout=20.0,
+    )
+    resp.raise_for_status()
+    return resp.json()["data"][0]["embedding"]
+
+
+async def draft_template(week_start: dt.date, race: Optional[Dict[str, Any]], injuries: List[Dict[str, Any]], summary14: Dict[str, Any], last_runs: List[Dict[str, Any]]) -> Tuple[str, Dict[str, Any]]:
     data = {
         "week_start": str(week_start),
-        "race": _json_sanitize(race),
-        "injuries": _json_sanitize(injuries),
-        "summary14": _json_sanitize(summary14),
-        "last_runs": _json_sanitize(last_runs),
+        "race": race,
+        "injuries": injuries,
+        "summary14": summary14,
+        "last_runs": last_runs,
         "prompt_version": "weekly_plan_v1",
     }
 
     persona = _read_prompt("/app/prompts/persona.md")
     tmpl = _read_prompt("/app/prompts/weekly_plan.md")
-    user = _render_prompt(tmpl, data)
 
-    text = _openai_generate(system=persona, user=user)
+    text = await _openai_generate_async(system=[persona, tmpl], user=_data_message(data))
     if not text:
         # fallback (should be rare)
         text = "주간 플랜 초안 생성 실패(LLM 응답 없음)."
@@ -391,43 +511,37 @@ def draft_template(week_start: dt.date, race: Optional[Dict[str, Any]], injuries
     return text, data
 
 
-def save_draft(week_start: dt.date, text: str, data: Dict[str, Any], *, turn_count: int = 0, last_user_feedback: Optional[str] = None) -> int:
-    conn = get_db_connection()
-    cur = conn.cursor()
-
-    # next version
-    cur.execute(
-        "SELECT COALESCE(MAX(version),0)+1 FROM training_plan_draft_weekly WHERE week_start=%s",
-        (week_start,),
-    )
-    version = cur.fetchone()[0]
-
-    cur.execute(
-        """
-        INSERT INTO training_plan_draft_weekly (week_start, version, draft_text, draft_data, status)
-        VALUES (%s,%s,%s,%s,'draft')
-        RETURNING id
-        """,
-        (week_start, int(version), text, Json(data)),
-    )
-    draft_id = cur.fetchone()[0]
+async def save_draft(week_start: dt.date, text: str, data: Dict[str, Any], *, turn_count: int = 0, last_user_feedback: Optional[str] = None) -> int:
+    async with get_conn() as conn, conn.cursor() as cur:
+        # next version
+        await cur.execute(
+            "SELECT COALESCE(MAX(version),0)+1 FROM training_plan_draft_weekly WHERE week_start=%s",
+            (week_start,),
+        )
+        version = (await cur.fetchone())[0]
 
-    cur.execute(
-        """
-        INSERT INTO coach_session (week_start, turn_count, status, last_message, updated_at)
-        VALUES (%s, %s, 'draft', %s, NOW())
-        ON CONFLICT (week_start) DO UPDATE SET
-          turn_count=EXCLUDED.turn_count,
-          status='draft',
-          last_message=EXCLUDED.last_message,
-          updated_at=NOW();
-        """,
-        (week_start, int(turn_count), (text[:3500] if text else "")),
-    )
+        await cur.execute(
+            """
+            INSERT INTO training_plan_draft_weekly (week_start, version, draft_text, draft_data, status)
+            VALUES (%s,%s,%s,%s,'draft')
+            RETURNING id
+            """,
+            (week_start, int(version), text, Jsonb(data, dumps=_json_dumps)),
+        )
+        draft_id = (await cur.fetchone())[0]
 
-    conn.commit()
-    cur.close()
-    conn.close()
+        await cur.execute(
+            """
+            INSERT INTO coach_session (week_start, turn_count, status, last_message, updated_at)
+            VALUES (%s, %s, 'draft', %s, NOW())
+            ON CONFLICT (week_start) DO UPDATE SET
+              turn_count=EXCLUDED.turn_count,
+              status='draft',
+              last_message=EXCLUDED.last_message,
+              updated_at=NOW();
+            """,
+            (week_start, int(turn_count), (text[:3500] if text else "")),
+        )
     return int(draft_id)
 
 
@@ -436,195 +550,175 @@ async def send_telegram(message: str):
         logger.error("COACH_TELEGRAM_BOT_TOKEN or TELEGRAM_ADMIN_ID not configured")
         return
 
-    from telegram import Bot
-
-    bot = Bot(token=TELEGRAM_BOT_TOKEN)
     # Telegram message length limit safety
     if len(message) > 3800:
         message = message[:3800] + "\n…(truncated)"
-    await bot.send_message(chat_id=TELEGRAM_ADMIN_ID, text=message)
-
-
-def _expire_existing_drafts(week_start: dt.date, *, new_status: str = "superseded"):
-    conn = get_db_connection()
-    cur = conn.cursor()
-    cur.execute(
-        "UPDATE training_plan_draft_weekly SET status=%s WHERE week_start=%s AND status='draft'",
-        (new_status, week_start),
-    )
-    conn.commit()
-    cur.close()
-    conn.close()
+    # Plain Bot API call on the shared client (no per-send Bot/session setup).
+    # Errors are rebuilt without the request URL: it carries the bot token, and
+    # callers log/store str(e).
+    try:
+        resp = await get_http_client().post(
+            f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage",
+            json={"chat_id": TELEGRAM_ADMIN_ID, "text": message},
+        )
+    except httpx.HTTPError as e:
+        raise RuntimeError(f"Telegram send failed: {type(e).__name__}") from None
+    try:
+        body = resp.json()
+    except ValueError:
+        body = {}
+    if not body.get("ok"):
+        raise RuntimeError(f"Telegram send failed: HTTP {resp.status_code}: {body.get('description', '')}")
+
+
+async def _expire_existing_drafts(week_start: dt.date, *, new_status: str = "superseded"):
+    async with get_conn() as conn, conn.cursor() as cur:
+        await cur.execute(
+            "UPDATE training_plan_draft_weekly SET status=%s WHERE week_start=%s AND status='draft'",
+            (new_status, week_start),
+        )
 
 
-def _get_or_init_session(week_start: dt.date) -> Dict[str, Any]:
-    row = select_one("SELECT week_start, turn_count, status FROM coach_session WHERE week_start=%s", (week_start,))
+async def _get_or_init_session(week_start: dt.date) -> Dict[str, Any]:
+    row = await select_one("SELECT week_start, turn_count, status FROM coach_session WHERE week_start=%s", (week_start,))
     if row:
         return row
     # create placeholder
-    conn = get_db_connection()
-    cur = conn.cursor()
-    cur.execute(
-        "INSERT INTO coach_session (week_start, turn_count, status, last_message, updated_at) VALUES (%s,0,'draft','',NOW()) ON CONFLICT (week_start) DO NOTHING",
-        (week_start,),
-    )
-    conn.commit()
-    cur.close()
-    conn.close()
+    async with get_conn() as conn, conn.cursor() as cur:
+        await cur.execute(
+            "INSERT INTO coach_session (week_start, turn_count, status, last_message, updated_at) VALUES (%s,0,'draft','',NOW()) ON CONFLICT (week_start) DO NOTHING",
+            (week_start,),
+        )
     return {"week_start": week_start, "turn_count": 0, "status": "draft"}
 
 
-def run_draft_job(*, force: bool = False):
+async def run_draft_job(*, force: bool = False):
     local_now = tz_now()
     today = local_now.date()
     wk = next_week_start(today)
 
     logger.info(f"Draft job tick: now={local_now.isoformat()} next_week_start={wk}")
 
-    if has_confirmed_plan(wk):
+    state = await get_plan_state(wk)
+    if state["confirmed"]:
         logger.info("Skip: confirmed plan already exists")
         return
-    if (not force) and has_draft(wk):
+    if (not force) and state["draft"]:
         logger.info("Skip: draft already exists")
         return
 
     # expire previous active drafts if forcing regeneration
     if force:
-        _expire_existing_drafts(wk, new_status="expired")
-
-    session = _get_or_init_session(wk)
+        await _expire_existing_drafts(wk, new_status="expired")
 
-    race = get_next_race()
-    injuries = get_recent_injuries(5)
-    summary14 = get_running_summary_14d()
-    last_runs = get_last_runs(2)
+    session = await _get_or_init_session(wk)
 
-    text, data = draft_template(wk, race, injuries, summary14, last_runs)
-    draft_id = save_draft(wk, text, data, turn_count=int(session.get("turn_count") or 0))
+    race, injuries, summary14, last_runs = await get_draft_inputs()
 
-    import asyncio
+    text, data = await draft_template(wk, race, injuries, summary14, last_runs)
+    draft_id = await save_draft(wk, text, data, turn_count=int(session.get("turn_count") or 0))
 
-    asyncio.run(send_telegram(text + f"\n\n(draft_id={draft_id})"))
+    await send_telegram(text + f"\n\n(draft_id={draft_id})")
     logger.info(f"Draft sent. draft_id={draft_id}")
 
 
-def _mark_review_sent(activity_id: int, *, status: str, error: Optional[str] = None):
-    conn = get_db_connection()
-    cur = conn.cursor()
-    cur.execute(
-        """
-        INSERT INTO workout_review_log (activity_id, sent_at, status, model, prompt_version, error)
-        VALUES (%s, NOW(), %s, %s, %s, %s)
-        ON CONFLICT (activity_id) DO UPDATE SET
-          sent_at=EXCLUDED.sent_at,
-          status=EXCLUDED.status,
-          model=EXCLUDED.model,
-          prompt_version=EXCLUDED.prompt_version,
-          error=EXCLUDED.error;
-        """,
-        (activity_id, status, OPENAI_MODEL, "workout_review_v1", error),
-    )
-    conn.commit()
-    cur.close()
-    conn.close()
-
-
-def _already_reviewed(activity_id: int) -> bool:
-    row = select_one("SELECT activity_id, status FROM workout_review_log WHERE activity_id=%s", (activity_id,))
-    if not row:
-        return False
-    # If previously failed, allow retry later (next poll)
-    return row.get("status") == "sent"
-
+async def _mark_review_sent(activity_id: int, *, status: str, error: Optional[str] = None):
+    async with get_conn() as conn, conn.cursor() as cur:
+        await cur.execute(
+            """
+            INSERT INTO workout_review_log (activity_id, sent_at, status, model, prompt_version, error)
+            VALUES (%s, NOW(), %s, %s, %s, %s)
+            ON CONFLICT (activity_id) DO UPDATE SET
+              sent_at=EXCLUDED.sent_at,
+              status=EXCLUDED.status,
+              model=EXCLUDED.model,
+              prompt_version=EXCLUDED.prompt_version,
+              error=EXCLUDED.error;
+            """,
+            (activity_id, status, OPENAI_MODEL, "workout_review_v1", error),
+        )
 
-def _build_review_input(activity_id: int) -> Dict[str, Any]:
-    act = select_one(
-        """
-        SELECT activity_id, activity_name, start_time, duration_sec, distance_meters,
-               avg_hr, max_hr, avg_pace
-        FROM exercise_activity
-        WHERE activity_id=%s
-        """,
-        (activity_id,),
-    )
 
-    laps = select_all(
-        """
-        SELECT lap_index, distance_meters, duration_sec, avg_pace, avg_hr, max_hr
-        FROM exercise_lap
-        WHERE activity_id=%s
-        ORDER BY lap_index
-        """,
-        (activity_id,),
+async def _build_review_input(activity_id: int) -> Dict[str, Any]:
+    # Independent queries, each on its own pooled connection
+    act, laps, injuries, race = await asyncio.gather(
+        select_one(
+            """
+            SELECT activity_id, activity_name, start_time, duration_sec, distance_meters,
+                   avg_hr, max_hr, avg_pace
+            FROM exercise_activity
+            WHERE activity_id=%s
+            """,
+            (activity_id,),
+        ),
+        select_all(
+            """
+            SELECT lap_index, distance_meters, duration_sec, avg_pace, avg_hr, max_hr
+            FROM exercise_lap
+            WHERE activity_id=%s
+            ORDER BY lap_index
+            """,
+            (activity_id,),
+        ),
+        get_recent_injuries(5),
+        get_next_race(),
     )
 
-    injuries = get_recent_injuries(5)
-    race = get_next_race()
-
     return {
-        "activity": _json_sanitize(act),
-        "laps": _json_sanitize(laps),
-        "injuries": _json_sanitize(injuries),
-        "next_race": _json_sanitize(race),
+        "activity": act,
+        "laps": laps,
+        "injuries": injuries,
+        "next_race": race,
         "tz": TZ,
     }
 
 
-def regenerate_weekly_draft_from_feedback(feedback_text: str) -> Optional[Dict[str, Any]]:
+async def regenerate_weekly_draft_from_feedback(feedback_text: str) -> Optional[Dict[str, Any]]:
     """Consume user feedback (1 turn) and regenerate the active weekly draft.
 
     Returns a dict with {draft_id, turn, text} on success.
-    NOTE: do not call asyncio.run() here; this can be invoked from an async handler.
     """
     local_now = tz_now()
     wk = next_week_start(local_now.date())
 
-    session = _get_or_init_session(wk)
+    session = await _get_or_init_session(wk)
     turn = int(session.get("turn_count") or 0)
     if turn >= 3:
         logger.info("Weekly draft turn limit reached (3)")
         return None
 
-    latest = get_latest_draft(wk)
+    latest = await get_latest_draft(wk)
     if not latest:
         # create one first
-        run_draft_job(force=False)
-        latest = get_latest_draft(wk)
+        await run_draft_job(force=False)
+        latest = await get_latest_draft(wk)
         if not latest:
             return None
 
     # expire current draft
-    _expire_existing_drafts(wk, new_status="superseded")
+    await _expire_existing_drafts(wk, new_status="superseded")
 
-    race = get_next_race()
-    injuries = get_recent_injuries(5)
-    summary14 = get_running_summary_14d()
-    last_runs = get_last_runs(2)
+    race, injuries, summary14, last_runs = await get_draft_inputs()
 
     # include feedback as high-priority constraints
-    base_text, data = draft_template(wk, race, injuries, summary14, last_runs)
+    base_text, data = await draft_template(wk, race, injuries, summary14, last_runs)
     data["user_feedback"] = (feedback_text or "").strip()
     data["turn_index"] = turn + 1
 
     persona = _read_prompt("/app/prompts/persona.md")
     tmpl = _read_prompt("/app/prompts/weekly_plan.md")
-    user = _render_prompt(tmpl, data)
-    text = _openai_generate(system=persona, user=user)
+    text = await _openai_generate_async(system=[persona, tmpl], user=_data_message(data))
     if not text:
         text = base_text
 
     # increment turn
-    conn = get_db_connection()
-    cur = conn.cursor()
-    cur.execute(
-        "UPDATE coach_session SET turn_count=turn_count+1, updated_at=NOW() WHERE week_start=%s",
-        (wk,),
-    )
-    conn.commit()
-    cur.close()
-    conn.close()
+    async with get_conn() as conn, conn.cursor() as cur:
+        await cur.execute(
+            "UPDATE coach_session SET turn_count=turn_count+1, updated_at=NOW() WHERE week_start=%s",
+            (wk,),
+        )
 
-    draft_id = save_draft(wk, text, data, turn_count=turn + 1)
+    draft_id = await save_draft(wk, text, data, turn_count=turn + 1)
     return {"draft_id": draft_id, "turn": turn + 1, "text": text}
 
 
@@ -701,10 +795,10 @@ def _parse_weekly_plan_days(text: str) -> List[Dict[str, Any]]:
     return days
 
 
-def confirm_weekly_plan() -> Dict[str, Any]:
+async def confirm_weekly_plan() -> Dict[str, Any]:
     """Confirm the latest draft for next week into training_plan_weekly/day."""
     wk = next_week_start(tz_now().date())
-    d = get_latest_draft(wk)
+    d = await get_latest_draft(wk)
     if not d or not d.get("draft_text"):
         raise RuntimeError("No active draft to confirm")
 
@@ -714,128 +808,209 @@ def confirm_weekly_plan() -> Dict[str, Any]:
     # derive plan days
     day_rows = _parse_weekly_plan_days(draft_text)
 
-    conn = get_db_connection()
-    cur = conn.cursor()
-
-    # upsert weekly
-    cur.execute(
-        """
-        INSERT INTO training_plan_weekly (week_start, race_event_id, raw_plan_text, prompt_version, model)
-        VALUES (%s, %s, %s, %s, %s)
-        ON CONFLICT (week_start) DO UPDATE SET
-          race_event_id=EXCLUDED.race_event_id,
-          raw_plan_text=EXCLUDED.raw_plan_text,
-          prompt_version=EXCLUDED.prompt_version,
-          model=EXCLUDED.model,
-          created_at=NOW();
-        """,
-        (
-            wk,
-            (draft_data.get("race") or {}).get("id") if isinstance(draft_data.get("race"), dict) else None,
-            draft_text,
-            str(draft_data.get("prompt_version") or "weekly_plan_v1"),
-            OPENAI_MODEL,
-        ),
-    )
-
-    # clear existing day rows for that week
-    cur.execute(
-        "DELETE FROM training_plan_day WHERE plan_date >= %s AND plan_date <= %s",
-        (wk, wk + dt.timedelta(days=6)),
-    )
-
-    for day in day_rows:
-        cur.execute(
+    async with get_conn() as conn, conn.cursor() as cur:
+        # upsert weekly
+        await cur.execute(
             """
-            INSERT INTO training_plan_day (week_start, plan_date, session_type, duration_min, distance_km, intensity, notes)
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
-            ON CONFLICT (plan_date) DO UPDATE SET
-              week_start=EXCLUDED.week_start,
-              session_type=EXCLUDED.session_type,
-              duration_min=EXCLUDED.duration_min,
-              distance_km=EXCLUDED.distance_km,
-              intensity=EXCLUDED.intensity,
-              notes=EXCLUDED.notes;
+            INSERT INTO training_plan_weekly (week_start, race_event_id, raw_plan_text, prompt_version, model)
+            VALUES (%s, %s, %s, %s, %s)
+            ON CONFLICT (week_start) DO UPDATE SET
+              race_event_id=EXCLUDED.race_event_id,
+              raw_plan_text=EXCLUDED.raw_plan_text,
+              prompt_version=EXCLUDED.prompt_version,
+              model=EXCLUDED.model,
+              created_at=NOW();
             """,
             (
                 wk,
-                day["plan_date"],
-                day.get("session_type"),
-                day.get("duration_min"),
-                day.get("distance_km"),
-                day.get("intensity"),
-                day.get("notes"),
+                (draft_data.get("race") or {}).get("id") if isinstance(draft_data.get("race"), dict) else None,
+                draft_text,
+                str(draft_data.get("prompt_version") or "weekly_plan_v1"),
+                OPENAI_MODEL,
             ),
         )
 
-    # mark session confirmed
-    cur.execute(
-        "UPDATE coach_session SET status='confirmed', updated_at=NOW() WHERE week_start=%s",
-        (wk,),
-    )
-    # mark draft confirmed
-    cur.execute(
-        "UPDATE training_plan_draft_weekly SET status='confirmed' WHERE id=%s",
-        (int(d.get("id")),),
-    )
+        # clear existing day rows for that week
+        await cur.execute(
+            "DELETE FROM training_plan_day WHERE plan_date >= %s AND plan_date <= %s",
+            (wk, wk + dt.timedelta(days=6)),
+        )
+
+        for day in day_rows:
+            await cur.execute(
+                """
+                INSERT INTO training_plan_day (week_start, plan_date, session_type, duration_min, distance_km, intensity, notes)
+                VALUES (%s, %s, %s, %s, %s, %s, %s)
+                ON CONFLICT (plan_date) DO UPDATE SET
+                  week_start=EXCLUDED.week_start,
+                  session_type=EXCLUDED.session_type,
+                  duration_min=EXCLUDED.duration_min,
+                  distance_km=EXCLUDED.distance_km,
+                  intensity=EXCLUDED.intensity,
+                  notes=EXCLUDED.notes;
+                """,
+                (
+                    wk,
+                    day["plan_date"],
+                    day.get("session_type"),
+                    day.get("duration_min"),
+                    day.get("distance_km"),
+                    day.get("intensity"),
+                    day.get("notes"),
+                ),
+            )
 
-    conn.commit()
-    cur.close()
-    conn.close()
+        # mark session confirmed
+        await cur.execute(
+            "UPDATE coach_session SET status='confirmed', updated_at=NOW() WHERE week_start=%s",
+            (wk,),
+        )
+        # mark draft confirmed
+        await cur.execute(
+            "UPDATE training_plan_draft_weekly SET status='confirmed' WHERE id=%s",
+            (int(d.get("id")),),
+        )
 
     return {"week_start": str(wk), "draft_id": int(d.get("id")), "days": len(day_rows)}
 
 
-def run_review_poll():
-    """Find newest running activities and send review once per activity."""
+def _review_cache_text(data: Dict[str, Any]) -> str:
+    """Canonical text embedded for the review cache (activity_id is only an identifier)."""
+    activity = {k: v for k, v in (data.get("activity") or {}).items() if k != "activity_id"}
+    return _json_dumps({**data, "activity": activity}, sort_keys=True)
+
+
+async def _review_cache_lookup(embedding: List[float]) -> Optional[str]:
+    # No pgvector in this Postgres: embeddings are stored as REAL[] and, being unit
+    # length (OpenAI), cosine similarity is just the dot product, computed in SQL.
+    row = await select_one(
+        """
+        SELECT response, sim FROM (
+          SELECT response,
+                 (SELECT SUM(a * b) FROM unnest(embedding, %s::real[]) AS t(a, b)) AS sim
+          FROM review_cache
+          WHERE model=%s AND created_at >= NOW() - INTERVAL '180 days'
+        ) c
+        WHERE sim >= %s
+        ORDER BY sim DESC
+        LIMIT 1
+        """,
+        (embedding, OPENAI_MODEL, REVIEW_CACHE_MIN_SIMILARITY),
+    )
+    return row["response"] if row else None
+
+
+async def _review_cache_store(embedding: List[float], response: str):
+    async with get_conn() as conn, conn.cursor() as cur:
+        await cur.execute(
+            "INSERT INTO review_cache (embedding, response, model) VALUES (%s, %s, %s)",
+            (embedding, response, OPENAI_MODEL),
+        )
+
+
+async def run_review_poll():
+    """Send a review for the newest not-yet-reviewed running activity (at most 1 per poll)."""
     logger.info("Review poll tick")
-    latest = select_all(
+    # Among the latest 5 runs, the newest one without a 'sent' review (failed ones are retried)
+    row = await select_one(
         """
-        SELECT activity_id
-        FROM exercise_activity
-        WHERE activity_type='running'
-        ORDER BY start_time DESC NULLS LAST
-        LIMIT 5
+        SELECT a.activity_id
+        FROM (
+          SELECT activity_id, start_time
+          FROM exercise_activity
+          WHERE activity_type='running'
+          ORDER BY start_time DESC NULLS LAST
+          LIMIT 5
+        ) a
+        LEFT JOIN workout_review_log r ON r.activity_id=a.activity_id AND r.status='sent'
+        WHERE r.activity_id IS NULL
+        ORDER BY a.start_time DESC NULLS LAST
+        LIMIT 1
         """
     )
-    for row in latest:
-        aid = int(row["activity_id"])
-        if _already_reviewed(aid):
-            continue
+    if not row:
+        return
+    aid = int(row["activity_id"])
 
-        try:
-            data = _build_review_input(aid)
+    try:
+        data = await _build_review_input(aid)
+
+        text = None
+        embedding = None
+        if REVIEW_CACHE_ENABLED:
+            try:
+                embedding = await _openai_embed_async(_review_cache_text(data))
+                text = await _review_cache_lookup(embedding)
+                if text:
+                    logger.info(f"Workout review cache hit for activity_id={aid}")
+            except Exception as e:
+                logger.warning(f"Review cache lookup failed (falling back to LLM): {e}")
+
+        if not text:
             persona = _read_prompt("/app/prompts/persona.md")
             tmpl = _read_prompt("/app/prompts/workout_review.md")
-            user = _render_prompt(tmpl, data)
-            text = _openai_generate(system=persona, user=user)
+            text = await _openai_generate_async(system=[persona, tmpl], user=_data_message(data))
             if not text:
                 raise RuntimeError("empty LLM response")
+            if embedding is not None:
+                try:
+                    await _review_cache_store(embedding, text)
+                except Exception as e:
+                    logger.warning(f"Review cache store failed: {e}")
+
+        await send_telegram(text)
+        await _mark_review_sent(aid, status="sent")
+        logger.info(f"Workout review sent for activity_id={aid}")
+    except Exception as e:
+        logger.error(f"Workout review failed for activity_id={aid}: {e}")
+        await _mark_review_sent(aid, status="failed", error=str(e)[:500])
+
+
+# Weekly draft slot (local TZ): Sunday 23:00. Review polls run every REVIEW_POLL_SECONDS.
+DRAFT_WEEKDAY = 6  # Mon=0..Sun=6
+DRAFT_TIME = dt.time(23, 0)
+REVIEW_POLL_SECONDS = 5 * 60
 
-            import asyncio
 
-            asyncio.run(send_telegram(text))
-            _mark_review_sent(aid, status="sent")
-            logger.info(f"Workout review sent for activity_id={aid}")
-            # only send 1 per poll to avoid spam bursts
-            break
+def _next_draft_run(after: dt.datetime) -> dt.datetime:
+    """Earliest weekly draft slot strictly after `after` (tz-aware, local TZ)."""
+    tz = pytz.timezone(TZ)
+    day = after.date() + dt.timedelta(days=(DRAFT_WEEKDAY - after.weekday()) % 7)
+    run = tz.localize(dt.datetime.combine(day, DRAFT_TIME))
+    if run <= after:
+        run = tz.localize(dt.datetime.combine(day + dt.timedelta(days=7), DRAFT_TIME))
+    return run
+
+
+async def _draft_scheduler():
+    """Sleep until each Sunday slot and run the draft job; no polling."""
+    last_run = tz_now()
+    while True:
+        next_run = _next_draft_run(last_run)
+        delay = (next_run - tz_now()).total_seconds()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        try:
+            await run_draft_job()
         except Exception as e:
-            logger.error(f"Workout review failed for activity_id={aid}: {e}")
-            _mark_review_sent(aid, status="failed", error=str(e)[:500])
-            break
+            logger.error(f"Scheduled draft job failed: {e}")
+        last_run = next_run
 
 
-def _schedule_loop():
+async def _review_scheduler():
     while True:
-        schedule.run_pending()
-        time.sleep(30)
+        await asyncio.sleep(REVIEW_POLL_SECONDS)
+        try:
+            await run_review_poll()
+        except Exception as e:
+            logger.error(f"Scheduled review poll failed: {e}")
 
 
-def _telegram_bot_loop():
-    """Run coach bot polling to accept feedback and regenerate drafts."""
+def _build_telegram_app():
+    """Coach bot application that accepts feedback and regenerates drafts (None if not configured)."""
     if not TELEGRAM_BOT_TOKEN or not TELEGRAM_ADMIN_ID:
         logger.warning("Coach bot polling disabled (missing token/admin id)")
-        return
+        return None
 
     from telegram import Update
     from telegram.ext import ApplicationBuilder, ContextTypes, CommandHandler, MessageHandler, CallbackQueryHandler, filters
@@ -867,10 +1042,10 @@ def _telegram_bot_loop():
         if not await check_admin(update):
             return
 
-        run_draft_job(force=False)
+        await run_draft_job(force=False)
 
         wk = next_week_start(tz_now().date())
-        d = get_latest_draft(wk)
+        d = await get_latest_draft(wk)
         if d and d.get("draft_text"):
             txt = d["draft_text"]
             if len(txt) > 3800:
@@ -893,7 +1068,7 @@ def _telegram_bot_loop():
             return
 
         try:
-            res = regenerate_weekly_draft_from_feedback(txt)
+            res = await regenerate_weekly_draft_from_feedback(txt)
             if res is None:
                 await update.message.reply_text(
                     "이번 주 주간 플랜 수정 왕복 한도(3회)에 도달했어. (최대 3회)\n이제 확정하려면 /confirm_weekly_plan"
@@ -915,7 +1090,7 @@ def _telegram_bot_loop():
         if not await check_admin(update):
             return
         try:
-            res = confirm_weekly_plan()
+            res = await confirm_weekly_plan()
             await update.message.reply_text(
                 f"✅ 확정 완료! week_start={res['week_start']} (draft_id={res['draft_id']})\n일별 저장: {res['days']}개"
             )
@@ -933,7 +1108,7 @@ def _telegram_bot_loop():
             return
         if q.data == "confirm_weekly":
             try:
-                res = confirm_weekly_plan()
+                res = await confirm_weekly_plan()
                 await q.edit_message_text(
                     f"✅ 확정 완료! week_start={res['week_start']} (draft_id={res['draft_id']})\n일별 저장: {res['days']}개"
                 )
@@ -941,7 +1116,7 @@ def _telegram_bot_loop():
                 await q.edit_message_text(f"❌ 확정 실패: {e}")
         elif q.data == "cancel_weekly":
             wk = next_week_start(tz_now().date())
-            _expire_existing_drafts(wk, new_status="cancelled")
+            await _expire_existing_drafts(wk, new_status="cancelled")
             await q.edit_message_text("취소했어. 필요하면 /weekly_coach_plan 로 다시 초안 생성 가능")
         else:
             # noop
@@ -965,43 +1140,62 @@ def _telegram_bot_loop():
     app.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, on_text))
     app.add_error_handler(on_error)
 
-    logger.info("Coach bot polling started")
-    app.run_polling()
+    return app
 
 
-def main():
+async def _run():
     logger.info("worker-coach started")
-    time.sleep(10)
-    init_db()
+    await asyncio.sleep(10)
+    await init_db()
 
-    # schedules
-    schedule.every().sunday.at("23:00").do(run_draft_job)
+    # schedules (timer tasks on this loop)
+    schedulers = [asyncio.create_task(_draft_scheduler()), asyncio.create_task(_review_scheduler())]
     logger.info("Scheduled: weekly draft Sunday 23:00")
-
-    schedule.every(5).minutes.do(run_review_poll)
     logger.info("Scheduled: workout review poll every 5 minutes")
 
     # Optional manual one-shots
     if os.getenv("COACH_RUN_DRAFT_ON_START") == "1":
         logger.warning("COACH_RUN_DRAFT_ON_START=1 -> running draft job once")
         try:
-            run_draft_job(force=True)
+            await run_draft_job(force=True)
         except Exception as e:
             logger.error(f"Draft job failed on start: {e}")
 
     if os.getenv("COACH_RUN_REVIEW_ON_START") == "1":
         logger.warning("COACH_RUN_REVIEW_ON_START=1 -> running review poll once")
         try:
-            run_review_poll()
+            await run_review_poll()
         except Exception as e:
             logger.error(f"Review poll failed on start: {e}")
 
-    # run schedule loop in background
-    t = threading.Thread(target=_schedule_loop, daemon=True)
-    t.start()
+    # Stop cleanly on docker stop (SIGTERM) as well as Ctrl-C
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
 
-    # run telegram polling in main thread
-    _telegram_bot_loop()
+    app = _build_telegram_app()
+    try:
+        if app is None:
+            await stop.wait()
+            return
+        # Telegram polling shares the loop with the scheduler and the DB pool
+        async with app:
+            await app.start()
+            await app.updater.start_polling()
+            logger.info("Coach bot polling started")
+            await stop.wait()
+            await app.updater.stop()
+            await app.stop()
+    finally:
+        for task in schedulers:
+            task.cancel()
+        await close_http_client()
+        await close_db_pool()
+
+
+def main():
+    asyncio.run(_run())
 
 
 if __name__ == "__main__":
@@ -26,6 +26,10 @@ POSTGRES_USER = os.getenv("POSTGRES_USER", "clawd_user")
 POSTGRES_PASSWORD = os.getenv("POSTGRES_PASSWORD", "password")
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
 TELEGRAM_ADMIN_ID = os.getenv("TELEGRAM_ADMIN_ID")
+REDIS_HOST = os.getenv("REDIS_HOST", "redis")
+REDIS_PORT = int(os.getenv("REDIS_PORT", "6379"))
+REDIS_DB = int(os.getenv("REDIS_DB", "0"))
+REDIS_PASSWORD = os.getenv("REDIS_PASSWORD")
 OBSIDIAN_PATH = "/obsidian"
 
 # Retry configuration
@@ -188,6 +192,31 @@ def save_daily_stats(stats):
     cur.close()
     conn.close()
     logger.info(f"Saved daily stats for {date}")
+    invalidate_brief_cache(date)
+
+_redis_client = None
+
+def get_redis_client():
+    """Lazily created client; same connection settings as clawd's /brief cache."""
+    global _redis_client
+    if _redis_client is None:
+        import redis
+        _redis_client = redis.Redis(
+            host=REDIS_HOST,
+            port=REDIS_PORT,
+            db=REDIS_DB,
+            password=REDIS_PASSWORD,
+            socket_timeout=2,
+            socket_connect_timeout=2
+        )
+    return _redis_client
+
+def invalidate_brief_cache(date):
+    """Drop clawd's cached /brief message for this date so it re-reads Postgres."""
+    try:
+        get_redis_client().delete(f"brief:{date}")
+    except Exception as e:
+        logger.warning(f"Failed to invalidate brief cache for {date}: {e}")
 
 def save_activity(activity):
     """Save exercise activity to database."""
@@ -286,9 +315,7 @@ def format_pace(speed_mps):
     """Convert speed (m/s) to pace (min:sec/km)."""
     if not speed_mps or speed_mps <= 0:
         return None
-    pace_sec_per_km = 1000 / float(speed_mps)
-    minutes = int(pace_sec_per_km // 60)
-    seconds = int(pace_sec_per_km % 60)
+    minutes, seconds = divmod(int(1000 / float(speed_mps)), 60)
     return f"{minutes}:{seconds:02d}"
 
 